@@ -1,26 +1,102 @@
 """Low-level Collmex API client."""
 
+import atexit
+import codecs
 import csv
-import io
+import hashlib
+import json
+import tempfile
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
 from typing import Any
 
 import httpx
 
 from .config import CollmexConfig, get_config
+from .models import format_collmex_date, format_collmex_decimal
 
 
 class CollmexError(Exception):
     """Base exception for Collmex API errors."""
 
-    def __init__(self, message: str, error_code: str | None = None):
+    def __init__(self, message: str, error_code: str | None = None, line: int | None = None):
         super().__init__(message)
         self.error_code = error_code
+        # Line of the request (1 = LOGIN) the error refers to, if reported
+        self.line = line
 
 
 class CollmexAuthError(CollmexError):
     """Authentication failed."""
 
 
+class CollmexDialect(csv.Dialect):
+    """CSV dialect of the Collmex data exchange format."""
+
+    delimiter = ";"
+    quotechar = '"'
+    doublequote = True
+    skipinitialspace = False
+    lineterminator = "\r\n"
+    quoting = csv.QUOTE_ALL
+
+
+_shared_client: httpx.Client | None = None
+
+
+def _get_shared_client() -> httpx.Client:
+    """Return the process-wide HTTP client, creating it on first use.
+
+    Sharing one client keeps the TLS connection to Collmex alive across
+    CollmexAPI instances; it is closed when the interpreter exits.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            http2=True,
+            timeout=30.0,
+            # Long enough to survive the pauses between commands in `collmex shell`
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300.0),
+        )
+        atexit.register(_shared_client.close)
+    return _shared_client
+
+
+# Query parameter formatters, dispatched on the exact value type
+_PARAM_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    type(None): lambda _: "",
+    bool: lambda v: "1" if v else "0",
+    date: format_collmex_date,
+    Decimal: format_collmex_decimal,
+}
+
+
+def _format_param(value: Any) -> str:
+    """Format a query parameter as a Collmex CSV field."""
+    return _PARAM_FORMATTERS.get(type(value), str)(value)
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Re-split arbitrary byte chunks into lines, keeping line terminators.
+
+    The csv reader needs the terminators to tell record ends from line breaks
+    inside quoted fields.
+    """
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).splitlines(keepends=True)
+        # Hold back an unterminated tail (or a lone "\r" that may precede "\n")
+        pending = lines.pop() if lines and not lines[-1].endswith(b"\n") else b""
+        yield from lines
+    if pending:
+        yield pending
+
+
 class CollmexAPI:
     """Low-level Collmex API client.
 
@@ -30,10 +106,19 @@ class CollmexAPI:
     - Windows-1252 encoding
     - Login credentials prepended to each request
     - Multipart form data POST requests
+
+    Responses to read-only queries are cached in memory for
+    ``config.cache_ttl`` seconds, keyed by the encoded request payload.
+    If ``config.cache_dir`` is set, the parsed responses are also stored
+    there as JSON so later CLI runs can skip the request and CSV parsing.
     """
 
     ENCODING = "windows-1252"
-    CSV_DELIMITER = ";"
+    CSV_DIALECT = CollmexDialect
+    STREAM_CHUNK_SIZE = 65536
+    # Persisted responses are named <prefix><cache key>.json, so clear_cache()
+    # only ever deletes its own files from a possibly shared cache_dir
+    DISK_CACHE_PREFIX = "collmex-response-"
 
     def __init__(self, config: CollmexConfig | None = None):
         """Initialize the API client.
@@ -43,19 +128,58 @@ class CollmexAPI:
         """
         self.config = config or get_config()
         self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._cache: dict[str, tuple[float, list[list[str]]]] = {}
+        # use_cache=False neither reads nor stores cached responses;
+        # refresh_cache=True skips cached responses but stores the fresh ones
+        self.use_cache = True
+        self.refresh_cache = False
+        # The LOGIN row is identical for every request; encode it once
+        self._login_prefix = self._encode_csv([self._build_login_row()])
 
     @property
     def client(self) -> httpx.Client:
-        """Lazy-load HTTP client."""
+        """Lazy-load HTTP client (the shared, connection-pooling client)."""
         if self._client is None:
-            self._client = httpx.Client(timeout=30.0)
+            self._client = _get_shared_client()
         return self._client
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
+        """Close the HTTP client.
+
+        The shared client stays open for other instances until exit.
+        """
+        if self._client is not None and self._client is not _shared_client:
             self._client.close()
-            self._client = None
+        self._client = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Lazy-load async HTTP client for concurrent requests.
+
+        The client is bound to the running event loop, so close it with
+        aclose() before that loop ends.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def clear_cache(self) -> None:
+        """Drop all cached query responses, including persisted ones."""
+        self._cache.clear()
+        if self.config.cache_dir is not None:
+            for path in self.config.cache_dir.glob(f"{self.DISK_CACHE_PREFIX}*"):
+                path.unlink(missing_ok=True)
 
     def __enter__(self) -> "CollmexAPI":
         return self
@@ -63,77 +187,212 @@ class CollmexAPI:
     def __exit__(self, *args: Any) -> None:
         self.close()
 
-    def _encode_csv(self, rows: list[list[str]]) -> bytes:
+    def _encode_csv(self, rows: Iterable[list[Any]]) -> bytes:
         """Encode rows as Collmex CSV format.
 
         Args:
-            rows: List of rows, each row is a list of field values
+            rows: List of rows, each row is a list of field values (non-str
+                values are formatted like query parameters, None as empty)
 
         Returns:
             Encoded CSV bytes in Windows-1252
         """
-        output = io.StringIO()
-        writer = csv.writer(
-            output,
-            delimiter=self.CSV_DELIMITER,
-            quotechar='"',
-            quoting=csv.QUOTE_ALL,
-            lineterminator="\r\n",
+        # Every field is quoted (CollmexDialect), so each row is simply the
+        # escaped fields joined by '";"' - no csv.writer or str buffer needed.
+        return b"".join(
+            b'"'
+            + '";"'.join(
+                (f if type(f) is str else _format_param(f)).replace('"', '""') for f in row
+            ).encode(self.ENCODING)
+            + b'"\r\n'
+            for row in rows
         )
-        writer.writerows(rows)
-        return output.getvalue().encode(self.ENCODING)
 
-    def _decode_csv(self, data: bytes) -> list[list[str]]:
+    def _decode_csv(
+        self, chunks: Iterable[bytes], keep: Collection[str] | None = None
+    ) -> list[list[str]]:
         """Decode Collmex CSV response.
 
         Args:
-            data: Raw response bytes in Windows-1252
+            chunks: Response body in Windows-1252 as byte chunks (e.g. a
+                streamed HTTP body), decoded as they arrive
+            keep: Only collect rows of these record types (MESSAGE rows are
+                always kept so errors can be detected)
 
         Returns:
             List of rows, each row is a list of field values
         """
-        text = data.decode(self.ENCODING)
-        reader = csv.reader(
-            io.StringIO(text),
-            delimiter=self.CSV_DELIMITER,
-            quotechar='"',
-        )
-        return list(reader)
+        # Decode line by line so the full body never exists as one str
+        lines = codecs.iterdecode(_iter_lines(chunks), self.ENCODING)
+        # The stdlib reader is implemented in C (_csv); a shared dialect saves
+        # re-validating the format parameters on every call.
+        reader = csv.reader(lines, dialect=self.CSV_DIALECT)
+        if keep is None:
+            return list(reader)
+        # Filtering by the parsed first field (rather than a raw line prefix)
+        # stays correct for quoted fields spanning several lines.
+        keep = {*keep, "MESSAGE"}
+        return [r for r in reader if r and r[0] in keep]
 
     def _build_login_row(self) -> list[str]:
         """Build the LOGIN row for authentication."""
         return ["LOGIN", self.config.username, self.config.password]
 
-    def request(self, *rows: list[str]) -> list[list[str]]:
+    def _cache_key(self, payload: bytes, keep: Collection[str] | None = None) -> str:
+        """Build the response cache key for an encoded request payload."""
+        key = hashlib.blake2b(self.config.api_url.encode() + payload)
+        if keep is not None:
+            key.update(";".join(sorted(keep)).encode())
+        return key.hexdigest()
+
+    def request(
+        self,
+        *rows: list[Any],
+        cacheable: bool = False,
+        keep: Collection[str] | None = None,
+    ) -> list[list[str]]:
         """Send a request to the Collmex API.
 
         Args:
             *rows: CSV rows to send (LOGIN is prepended automatically)
+            cacheable: True for read-only queries whose response may be reused.
+                Non-cacheable requests (writes) invalidate the cache.
+            keep: Only return rows of these record types (plus MESSAGE rows);
+                other rows are dropped while parsing instead of materialized
 
         Returns:
-            List of response rows
+            List of response rows (shared with the cache, do not mutate)
 
         Raises:
             CollmexError: If the API returns an error
             CollmexAuthError: If authentication fails
         """
+        payload, cache_key = self._prepare_request(rows, cacheable, keep)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Send as multipart form data and parse the body while it streams in
+            with self.client.stream(
+                "POST",
+                self.config.api_url,
+                files={"file": ("data.csv", payload, "text/csv")},
+            ) as response:
+                response.raise_for_status()
+                result_rows = self._decode_csv(response.iter_bytes(self.STREAM_CHUNK_SIZE), keep)
+
+            return self._finish_request(result_rows, cache_key)
+        finally:
+            if not cacheable:
+                self.clear_cache()
+
+    async def arequest(
+        self,
+        *rows: list[Any],
+        cacheable: bool = False,
+        keep: Collection[str] | None = None,
+    ) -> list[list[str]]:
+        """Send a request to the Collmex API without blocking the event loop.
+
+        Async variant of request(), sharing its response cache.
+        """
+        payload, cache_key = self._prepare_request(rows, cacheable, keep)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with self.async_client.stream(
+                "POST",
+                self.config.api_url,
+                files={"file": ("data.csv", payload, "text/csv")},
+            ) as response:
+                response.raise_for_status()
+                chunks = [chunk async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE)]
+            result_rows = self._decode_csv(chunks, keep)
+
+            return self._finish_request(result_rows, cache_key)
+        finally:
+            if not cacheable:
+                self.clear_cache()
+
+    def _prepare_request(
+        self,
+        rows: Iterable[list[Any]],
+        cacheable: bool,
+        keep: Collection[str] | None,
+    ) -> tuple[bytes, str | None]:
+        """Encode the request payload and compute its cache key (if cacheable)."""
         # Prepend login row
-        all_rows = [self._build_login_row(), *rows]
-        payload = self._encode_csv(all_rows)
-
-        # Send as multipart form data
-        response = self.client.post(
-            self.config.api_url,
-            files={"file": ("data.csv", payload, "text/csv")},
-        )
-        response.raise_for_status()
-
-        # Parse response
-        result_rows = self._decode_csv(response.content)
-
-        # Check for errors
+        payload = self._login_prefix + self._encode_csv(rows)
+        cache_key = None
+        if cacheable and self.use_cache and self.config.cache_ttl > 0:
+            cache_key = self._cache_key(payload, keep)
+        return payload, cache_key
+
+    def _get_cached(self, cache_key: str | None) -> list[list[str]] | None:
+        """Return a cached, unexpired response if there is one."""
+        if cache_key is None or self.refresh_cache:
+            return None
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        if self.config.cache_dir is not None:
+            return self._read_disk_cache(cache_key)
+        return None
+
+    def _read_disk_cache(self, cache_key: str) -> list[list[str]] | None:
+        """Load an unexpired persisted response into the memory cache."""
+        path = self.config.cache_dir / f"{self.DISK_CACHE_PREFIX}{cache_key}.json"
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age >= self.config.cache_ttl:
+                return None
+            rows = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        self._cache[cache_key] = (time.monotonic() + self.config.cache_ttl - age, rows)
+        return rows
+
+    def _write_disk_cache(self, cache_key: str, rows: list[list[str]]) -> None:
+        """Persist a parsed response; failures only cost the cache entry."""
+        cache_dir = self.config.cache_dir
+        name = f"{self.DISK_CACHE_PREFIX}{cache_key}"
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file with mode 0600 (the responses contain
+            # accounting data) under a unique name, so concurrent runs don't
+            # write to the same temporary file
+            fd, tmp_name = tempfile.mkstemp(prefix=name, suffix=".tmp", dir=cache_dir)
+        except OSError:
+            return
+        tmp_path = Path(tmp_name)
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(rows, ensure_ascii=False))
+            tmp_path.replace(cache_dir / f"{name}.json")
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _finish_request(
+        self,
+        result_rows: list[list[str]],
+        cache_key: str | None,
+    ) -> list[list[str]]:
+        """Check a parsed response for errors and cache it (if cacheable).
+
+        Writes invalidate the cache in request()/arequest() instead, whether
+        or not they succeed: a rejected or interrupted multi-row write may
+        already have booked its earlier rows.
+        """
         self._check_errors(result_rows)
 
+        if cache_key is not None:
+            self._cache[cache_key] = (time.monotonic() + self.config.cache_ttl, result_rows)
+            if self.config.cache_dir is not None:
+                self._write_disk_cache(cache_key, result_rows)
+
         return result_rows
 
     def _check_errors(self, rows: list[list[str]]) -> None:
@@ -156,12 +415,14 @@ class CollmexAPI:
                 msg_type = row[1] if len(row) > 1 else ""
                 msg_code = row[2] if len(row) > 2 else ""
                 msg_text = row[3] if len(row) > 3 else "Unknown error"
+                msg_line = row[4] if len(row) > 4 else ""
 
                 if msg_type == "E":
                     # Check for auth errors
                     if msg_code in ("101001", "101002", "101003"):
                         raise CollmexAuthError(msg_text, msg_code)
-                    raise CollmexError(msg_text, msg_code)
+                    line = int(msg_line) if msg_line.isdigit() else None
+                    raise CollmexError(msg_text, msg_code, line)
 
     def query(self, record_type: str, **params: Any) -> list[list[str]]:
         """Execute a query against the Collmex API.
@@ -173,20 +434,12 @@ class CollmexAPI:
         Returns:
             List of result rows (excluding MESSAGE rows)
         """
-        # Build query row - first field is always the record type
-        row = [record_type]
-
-        # Add parameters in order (Collmex uses positional CSV fields)
+        # Build query row - first field is always the record type, followed by
+        # the parameters in order (Collmex uses positional CSV fields).
         # The caller must know the correct order
-        for value in params.values():
-            if value is None:
-                row.append("")
-            elif isinstance(value, bool):
-                row.append("1" if value else "0")
-            else:
-                row.append(str(value))
-
-        result = self.request(row)
+        row = [record_type, *map(_format_param, params.values())]
+
+        result = self.request(row, cacheable=True)
 
         # Filter out MESSAGE rows
         return [r for r in result if r and r[0] != "MESSAGE"]
@@ -1,17 +1,32 @@
 """High-level Collmex client for common operations."""
 
+import asyncio
+import time
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date
+from typing import Any
+
+from rapidfuzz import fuzz, process
 
 from .api import CollmexAPI
 from .config import CollmexConfig
 from .models import (
     AccountingDocument,
+    CollmexRecord,
     OpenItem,
     Vendor,
     VendorInvoice,
     format_collmex_date,
 )
 
+# Separators people put into IBANs and VAT IDs ("DE89 3704 ...", "DE-123...")
+_IDENTIFIER_CLEAN_TABLE = str.maketrans("", "", " \t\n-")
+
+
+def _normalize_identifier(value: str) -> str:
+    """Normalize an IBAN or VAT ID for comparison."""
+    return value.translate(_IDENTIFIER_CLEAN_TABLE).upper()
+
 
 class CollmexClient:
     """High-level client for Collmex API operations.
@@ -19,6 +34,14 @@ class CollmexClient:
     Provides typed methods for common accounting operations.
     """
 
+    VENDOR_CACHE_TTL = 300.0  # seconds
+    # Name matching uses token_sort_ratio (word order doesn't matter, 0-100).
+    # Near-miss spellings such as "Deutsche Bank"/"Deutsche Bahn" score ~92,
+    # so only reordered words or a substring hit count as a confident match;
+    # a single shared word ("Deutsche ...") stays below the cutoff.
+    NAME_MATCH_CUTOFF = 70
+    NAME_EXACT_SCORE = 0.95
+
     def __init__(self, config: CollmexConfig | None = None):
         """Initialize client.
 
@@ -26,6 +49,13 @@ class CollmexClient:
             config: Optional configuration. If not provided, loads from environment.
         """
         self.api = CollmexAPI(config)
+        self._vendor_cache: tuple[float, list[Vendor]] | None = None
+        self._iban_index: dict[str, Vendor] = {}
+        self._vat_index: dict[str, Vendor] = {}
+        # Parallel to the cached vendor list ("" for vendors without a name)
+        self._vendor_names: list[str] = []
+        self._vendor_names_lower: list[str] = []
+        self._vendor_name_index: dict[str, int] = {}
 
     def close(self) -> None:
         """Close the API connection."""
@@ -37,6 +67,17 @@ class CollmexClient:
     def __exit__(self, *args) -> None:
         self.close()
 
+    def batch(self) -> "Batch":
+        """Collect several queries and send them in a single API request.
+
+        Example:
+            with client.batch() as batch:
+                vendors = batch.get_vendors()
+                items = batch.get_open_items(vendor=True)
+            vendors.result(), items.result()
+        """
+        return Batch(self)
+
     # =========================================================================
     # Vendors (Lieferanten)
     # =========================================================================
@@ -57,18 +98,75 @@ class CollmexClient:
         Returns:
             List of Vendor objects
         """
-        row = ["VENDOR_GET"]
-        row.append(str(vendor_id) if vendor_id else "")
-        row.append(str(self.api.config.company_id))
-        row.append(text or "")
-        row.append("")  # due for follow-up
-        row.append("")  # postal code/country
-        row.append("1" if only_changed else "")
-        row.append("")  # system name
-
-        results = self.api.request(row)
+        row = self._vendors_query_row(vendor_id, text, only_changed)
+        results = self.api.request(row, cacheable=True, keep=("CMXLIF",))
         return [Vendor.from_csv_row(r) for r in results if r and r[0] == "CMXLIF"]
 
+    def iter_vendors(self, **kwargs: Any) -> Iterator[Vendor]:
+        """Like get_vendors() (same keyword arguments), but parse lazily."""
+        row = self._vendors_query_row(**kwargs)
+        results = self.api.request(row, cacheable=True, keep=("CMXLIF",))
+        return (Vendor.from_csv_row(r) for r in results if r and r[0] == "CMXLIF")
+
+    def project_vendors(self, fields: Sequence[str], **kwargs: Any) -> Iterator[tuple]:
+        """Like iter_vendors(), but yield only the named fields as tuples.
+
+        Skips model construction; see CollmexRecord.project_from_csv_row().
+        """
+        row = self._vendors_query_row(**kwargs)
+        results = self.api.request(row, cacheable=True, keep=("CMXLIF",))
+        return (
+            Vendor.project_from_csv_row(r, fields) for r in results if r and r[0] == "CMXLIF"
+        )
+
+    def _vendors_query_row(
+        self,
+        vendor_id: int | None = None,
+        text: str | None = None,
+        only_changed: bool = False,
+    ) -> list[str]:
+        """Build the VENDOR_GET query row."""
+        return [
+            "VENDOR_GET",
+            str(vendor_id) if vendor_id else "",
+            str(self.api.config.company_id),
+            text or "",
+            "",  # due for follow-up
+            "",  # postal code/country
+            "1" if only_changed else "",
+            "",  # system name
+        ]
+
+    def _get_vendors_cached(self) -> list[Vendor]:
+        """Get the full vendor list, reusing it for VENDOR_CACHE_TTL seconds.
+
+        Refreshing the list also rebuilds the lookup indexes used for matching.
+        """
+        now = time.monotonic()
+        if self._vendor_cache is None or self._vendor_cache[0] <= now:
+            vendors = self.get_vendors()
+            self._vendor_cache = (now + self.VENDOR_CACHE_TTL, vendors)
+            self._index_vendors(vendors)
+        return self._vendor_cache[1]
+
+    def _index_vendors(self, vendors: list[Vendor]) -> None:
+        """Build the IBAN/VAT ID indexes and the name arrays for matching."""
+        self._iban_index = {}
+        self._vat_index = {}
+        self._vendor_names = []
+        for v in vendors:
+            # setdefault keeps the first vendor, like the former linear scan
+            if v.iban:
+                self._iban_index.setdefault(_normalize_identifier(v.iban), v)
+            if v.vat_id:
+                self._vat_index.setdefault(_normalize_identifier(v.vat_id), v)
+            self._vendor_names.append(v.display_name)
+        self._vendor_names_lower = [n.lower() for n in self._vendor_names]
+        self._vendor_name_index = {}
+        for i, name_lower in enumerate(self._vendor_names_lower):
+            if name_lower:
+                self._vendor_name_index.setdefault(name_lower, i)
+
     def create_vendor(self, vendor: Vendor) -> list[str]:
         """Create or update a vendor.
 
@@ -78,6 +176,7 @@ class CollmexClient:
         Returns:
             Raw API response rows
         """
+        self._vendor_cache = None
         return self.api.request(vendor.to_csv_row())
 
     def match_vendor(
@@ -104,57 +203,79 @@ class CollmexClient:
             - {"match": "fuzzy", "candidates": [...]}
             - {"match": "none"}
         """
-        vendors = self.get_vendors()
+        vendors = self._get_vendors_cached()
 
         # 1. Try IBAN match (exact)
         if iban:
-            iban_clean = iban.replace(" ", "").upper()
-            for v in vendors:
-                if v.iban and v.iban.replace(" ", "").upper() == iban_clean:
-                    return {
-                        "match": "exact",
-                        "match_field": "iban",
-                        "vendor_id": v.vendor_id,
-                        "vendor": v.model_dump(),
-                    }
+            v = self._iban_index.get(_normalize_identifier(iban))
+            if v is not None:
+                return {
+                    "match": "exact",
+                    "match_field": "iban",
+                    "vendor_id": v.vendor_id,
+                    "vendor": v.model_dump(),
+                }
 
         # 2. Try VAT ID match (exact)
         if vat_id:
-            vat_clean = vat_id.replace(" ", "").upper()
-            for v in vendors:
-                if v.vat_id and v.vat_id.replace(" ", "").upper() == vat_clean:
-                    return {
-                        "match": "exact",
-                        "match_field": "vat_id",
-                        "vendor_id": v.vendor_id,
-                        "vendor": v.model_dump(),
-                    }
+            v = self._vat_index.get(_normalize_identifier(vat_id))
+            if v is not None:
+                return {
+                    "match": "exact",
+                    "match_field": "vat_id",
+                    "vendor_id": v.vendor_id,
+                    "vendor": v.model_dump(),
+                }
 
         # 3. Try name match (fuzzy)
         if name:
             name_lower = name.lower()
-            candidates = []
-            for v in vendors:
-                vendor_name = v.company_name or f"{v.first_name} {v.last_name}".strip()
-                if not vendor_name:
-                    continue
-                vendor_name_lower = vendor_name.lower()
-
-                # Calculate simple similarity score
-                score = self._fuzzy_score(name_lower, vendor_name_lower)
-                if score > 0.4:  # Threshold for consideration
+
+            # Identical name: no scoring needed
+            i = self._vendor_name_index.get(name_lower)
+            if i is not None:
+                return {
+                    "match": "exact",
+                    "match_field": "name",
+                    "vendor_id": vendors[i].vendor_id,
+                    "vendor": vendors[i].model_dump(),
+                }
+
+            names_lower = self._vendor_names_lower
+
+            # Score all names in one call (C++ implementation)
+            scores = {
+                i: score / 100
+                for _, score, i in process.extract(
+                    name_lower,
+                    names_lower,
+                    scorer=fuzz.token_sort_ratio,
+                    processor=None,
+                    limit=None,
+                    score_cutoff=self.NAME_MATCH_CUTOFF,
+                )
+            }
+            # Substring matches count as near-exact
+            for i, vendor_name_lower in enumerate(names_lower):
+                if vendor_name_lower and (
+                    name_lower in vendor_name_lower or vendor_name_lower in name_lower
+                ):
+                    scores[i] = max(scores.get(i, 0.0), self.NAME_EXACT_SCORE)
+
+            if scores:
+                # Sort by score descending
+                ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:5]  # Top 5
+                candidates = []
+                for i, score in ranked:
+                    v = vendors[i]
                     candidates.append({
                         "vendor_id": v.vendor_id,
-                        "name": vendor_name,
+                        "name": self._vendor_names[i],
                         "score": round(score, 2),
                         "vendor": v.model_dump(),
                     })
-
-            if candidates:
-                # Sort by score descending
-                candidates.sort(key=lambda x: x["score"], reverse=True)
                 # If top match is very good, return as exact
-                if candidates[0]["score"] > 0.9:
+                if ranked[0][1] >= self.NAME_EXACT_SCORE:
                     return {
                         "match": "exact",
                         "match_field": "name",
@@ -163,30 +284,11 @@ class CollmexClient:
                     }
                 return {
                     "match": "fuzzy",
-                    "candidates": candidates[:5],  # Top 5
+                    "candidates": candidates,
                 }
 
         return {"match": "none"}
 
-    def _fuzzy_score(self, s1: str, s2: str) -> float:
-        """Calculate fuzzy match score between two strings.
-
-        Uses a simple approach: longest common subsequence ratio.
-        """
-        # Check for substring match first
-        if s1 in s2 or s2 in s1:
-            return 0.95
-
-        # Simple token overlap
-        tokens1 = set(s1.split())
-        tokens2 = set(s2.split())
-        if not tokens1 or not tokens2:
-            return 0.0
-
-        intersection = tokens1 & tokens2
-        union = tokens1 | tokens2
-        return len(intersection) / len(union)
-
     # =========================================================================
     # Vendor Invoices (Lieferantenrechnungen)
     # =========================================================================
@@ -202,6 +304,21 @@ class CollmexClient:
         """
         return self.api.request(invoice.to_csv_row())
 
+    def create_vendor_invoices_batch(self, invoices: Iterable[VendorInvoice]) -> list[list[str]]:
+        """Create several vendor invoices in a single API request.
+
+        Args:
+            invoices: VendorInvoice objects, booked in order
+
+        Returns:
+            Raw API response rows
+
+        Raises:
+            CollmexError: If Collmex rejects an invoice; its line attribute
+                minus one is the 1-based position of that invoice
+        """
+        return self.api.request(*(invoice.to_csv_row() for invoice in invoices))
+
     # =========================================================================
     # Open Items (Offene Posten)
     # =========================================================================
@@ -224,17 +341,45 @@ class CollmexClient:
         Returns:
             List of OpenItem objects
         """
-        row = ["OPEN_ITEMS_GET"]
-        row.append(str(self.api.config.company_id))
-        row.append("1" if vendor else "0")
-        row.append(str(customer_id) if customer_id else "")
-        row.append(str(vendor_id) if vendor_id else "")
-        row.append("")  # vermittler
-        row.append(format_collmex_date(cutoff_date) if cutoff_date else "")
-
-        results = self.api.request(row)
+        row = self._open_items_query_row(vendor, customer_id, vendor_id, cutoff_date)
+        results = self.api.request(row, cacheable=True, keep=("OPEN_ITEM",))
         return [OpenItem.from_csv_row(r) for r in results if r and r[0] == "OPEN_ITEM"]
 
+    def iter_open_items(self, **kwargs: Any) -> Iterator[OpenItem]:
+        """Like get_open_items() (same keyword arguments), but parse lazily."""
+        row = self._open_items_query_row(**kwargs)
+        results = self.api.request(row, cacheable=True, keep=("OPEN_ITEM",))
+        return (OpenItem.from_csv_row(r) for r in results if r and r[0] == "OPEN_ITEM")
+
+    def project_open_items(self, fields: Sequence[str], **kwargs: Any) -> Iterator[tuple]:
+        """Like iter_open_items(), but yield only the named fields as tuples.
+
+        Skips model construction; see CollmexRecord.project_from_csv_row().
+        """
+        row = self._open_items_query_row(**kwargs)
+        results = self.api.request(row, cacheable=True, keep=("OPEN_ITEM",))
+        return (
+            OpenItem.project_from_csv_row(r, fields) for r in results if r and r[0] == "OPEN_ITEM"
+        )
+
+    def _open_items_query_row(
+        self,
+        vendor: bool = False,
+        customer_id: int | None = None,
+        vendor_id: int | None = None,
+        cutoff_date: date | None = None,
+    ) -> list[str]:
+        """Build the OPEN_ITEMS_GET query row."""
+        return [
+            "OPEN_ITEMS_GET",
+            str(self.api.config.company_id),
+            "1" if vendor else "0",
+            str(customer_id) if customer_id else "",
+            str(vendor_id) if vendor_id else "",
+            "",  # vermittler
+            format_collmex_date(cutoff_date) if cutoff_date else "",
+        ]
+
     # =========================================================================
     # Accounting Documents (Buchungen)
     # =========================================================================
@@ -268,28 +413,120 @@ class CollmexClient:
             include_cancelled: Include cancelled bookings
             only_changed: Only return changed records
 
+        With a fiscal_year, the date range is applied locally to the whole
+        year's response, so one cached query serves every date range.
+
         Returns:
             List of AccountingDocument objects
         """
-        row = ["ACCDOC_GET"]
-        row.append(str(self.api.config.company_id))
-        row.append(str(fiscal_year) if fiscal_year else "")
-        row.append(str(booking_id) if booking_id else "")
-        row.append(str(account_number) if account_number else "")
-        row.append("")  # cost center
-        row.append(str(customer_id) if customer_id else "")
-        row.append(str(vendor_id) if vendor_id else "")
-        row.append("")  # asset number
-        row.append(str(invoice_number) if invoice_number else "")
-        row.append("")  # travel number
-        row.append(text or "")
-        row.append(format_collmex_date(date_from) if date_from else "")
-        row.append(format_collmex_date(date_to) if date_to else "")
-        row.append("1" if include_cancelled else "")
-        row.append("1" if only_changed else "")
-
-        results = self.api.request(row)
-        return [AccountingDocument.from_csv_row(r) for r in results if r and r[0] == "ACCDOC"]
+        return list(self.iter_bookings(
+            fiscal_year=fiscal_year,
+            booking_id=booking_id,
+            account_number=account_number,
+            customer_id=customer_id,
+            vendor_id=vendor_id,
+            invoice_number=invoice_number,
+            text=text,
+            date_from=date_from,
+            date_to=date_to,
+            include_cancelled=include_cancelled,
+            only_changed=only_changed,
+        ))
+
+    def iter_bookings(self, **kwargs: Any) -> Iterator[AccountingDocument]:
+        """Like get_bookings() (same keyword arguments), but parse lazily.
+
+        The request is sent immediately; each row is only turned into an
+        AccountingDocument when the iterator reaches it, so filtering callers
+        never hold a second full list.
+        """
+        date_from, date_to = self._local_date_range(kwargs)
+        row = self._bookings_query_row(**kwargs)
+        results = self.api.request(row, cacheable=True, keep=("ACCDOC",))
+        return map(AccountingDocument.from_csv_row, self._booking_rows(results, date_from, date_to))
+
+    def project_bookings(self, fields: Sequence[str], **kwargs: Any) -> Iterator[tuple]:
+        """Like iter_bookings(), but yield only the named fields as tuples.
+
+        Skips model construction; see CollmexRecord.project_from_csv_row().
+        """
+        date_from, date_to = self._local_date_range(kwargs)
+        row = self._bookings_query_row(**kwargs)
+        results = self.api.request(row, cacheable=True, keep=("ACCDOC",))
+        return (
+            AccountingDocument.project_from_csv_row(r, fields)
+            for r in self._booking_rows(results, date_from, date_to)
+        )
+
+    async def aget_bookings(self, **kwargs: Any) -> list[AccountingDocument]:
+        """Async variant of get_bookings() (same keyword arguments)."""
+        date_from, date_to = self._local_date_range(kwargs)
+        row = self._bookings_query_row(**kwargs)
+        results = await self.api.arequest(row, cacheable=True, keep=("ACCDOC",))
+        return list(map(AccountingDocument.from_csv_row, self._booking_rows(results, date_from, date_to)))
+
+    @staticmethod
+    def _local_date_range(kwargs: dict[str, Any]) -> tuple[date | None, date | None]:
+        """Take the date range out of a fiscal-year query to filter it locally.
+
+        The server then sees the same query for every range within a year, so
+        the cached year response is reused while a user narrows the dates.
+        Without a fiscal year the server keeps filtering (the unfiltered
+        response could span every year).
+        """
+        if kwargs.get("fiscal_year") is None:
+            return None, None
+        return kwargs.pop("date_from", None), kwargs.pop("date_to", None)
+
+    @staticmethod
+    def _booking_rows(
+        results: list[list[str]], date_from: date | None, date_to: date | None
+    ) -> Iterator[list[str]]:
+        """Select the ACCDOC rows whose document date is within the range.
+
+        Dates are compared in their raw YYYYMMDD form, so rows outside the
+        range are dropped before anything is parsed.
+        """
+        rows = (r for r in results if r and r[0] == "ACCDOC")
+        if date_from is None and date_to is None:
+            return rows
+        start = format_collmex_date(date_from) if date_from else "00000000"
+        end = format_collmex_date(date_to) if date_to else "99999999"
+        return (r for r in rows if len(r) > 4 and r[4] and start <= r[4] <= end)
+
+    def _bookings_query_row(
+        self,
+        fiscal_year: int | None = None,
+        booking_id: int | None = None,
+        account_number: int | None = None,
+        customer_id: int | None = None,
+        vendor_id: int | None = None,
+        invoice_number: str | None = None,
+        text: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        include_cancelled: bool = False,
+        only_changed: bool = False,
+    ) -> list[str]:
+        """Build the ACCDOC_GET query row."""
+        return [
+            "ACCDOC_GET",
+            str(self.api.config.company_id),
+            str(fiscal_year) if fiscal_year else "",
+            str(booking_id) if booking_id else "",
+            str(account_number) if account_number else "",
+            "",  # cost center
+            str(customer_id) if customer_id else "",
+            str(vendor_id) if vendor_id else "",
+            "",  # asset number
+            str(invoice_number) if invoice_number else "",
+            "",  # travel number
+            text or "",
+            format_collmex_date(date_from) if date_from else "",
+            format_collmex_date(date_to) if date_to else "",
+            "1" if include_cancelled else "",
+            "1" if only_changed else "",
+        ]
 
     def get_unmatched_bank_transactions(
         self,
@@ -311,22 +548,154 @@ class CollmexClient:
         Returns:
             List of unmatched bank transactions
         """
-        # Get all bank account bookings
-        bookings = self.get_bookings(
+        # Filter all bank account bookings in a single pass
+        bookings = self.iter_bookings(
             fiscal_year=fiscal_year,
             account_number=bank_account,
             date_from=date_from,
             date_to=date_to,
         )
+        return [b for b in bookings if self._is_unmatched(b)]
+
+    def get_unmatched_bank_transactions_multi(
+        self,
+        bank_accounts: list[int],
+        fiscal_year: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> dict[int, list[AccountingDocument]]:
+        """Get unmatched bank transactions for several bank accounts at once.
+
+        The per-account queries are sent concurrently, so the total wait is
+        about one round-trip instead of one per account.
+
+        Args:
+            bank_accounts: Bank account numbers (e.g. [1200, 1210])
+            fiscal_year: Filter by fiscal year
+            date_from: Start date filter
+            date_to: End date filter
+
+        Returns:
+            Unmatched bank transactions per bank account
+        """
+        return asyncio.run(
+            self._aget_unmatched_multi(bank_accounts, fiscal_year, date_from, date_to)
+        )
+
+    async def _aget_unmatched_multi(
+        self,
+        bank_accounts: list[int],
+        fiscal_year: int | None,
+        date_from: date | None,
+        date_to: date | None,
+    ) -> dict[int, list[AccountingDocument]]:
+        try:
+            results = await asyncio.gather(*[
+                self.aget_bookings(
+                    fiscal_year=fiscal_year,
+                    account_number=account,
+                    date_from=date_from,
+                    date_to=date_to,
+                )
+                for account in bank_accounts
+            ])
+        finally:
+            # The async client is bound to this event loop
+            await self.api.aclose()
+        return {
+            account: [b for b in bookings if self._is_unmatched(b)]
+            for account, bookings in zip(bank_accounts, results)
+        }
+
+    @staticmethod
+    def _is_unmatched(booking: AccountingDocument) -> bool:
+        """Check whether a bank booking still lacks a counter-booking.
+
+        Imported bank transactions without vendor/customer assignment and
+        without an invoice number typically need matching.
+        """
+        return booking.vendor_id is None and booking.customer_id is None and not booking.invoice_number
+
+
+# =============================================================================
+# Batching
+# =============================================================================
+
+
+class BatchResult[T: CollmexRecord]:
+    """Result of a batched query, available once the batch has been sent."""
+
+    def __init__(self) -> None:
+        self._records: list[T] | None = None
+
+    def result(self) -> list[T]:
+        """Return the parsed records.
+
+        Raises:
+            RuntimeError: If the batch has not been sent yet
+        """
+        if self._records is None:
+            raise RuntimeError("Batch has not been sent yet")
+        return self._records
+
+
+class Batch:
+    """Queue of queries sent to Collmex as one multi-row request.
+
+    The response rows are routed back to each query by their record type, so
+    a batch can hold at most one query per record type.
+    """
+
+    def __init__(self, client: CollmexClient):
+        self._client = client
+        self._pending: list[tuple[list[str], str, type[CollmexRecord], BatchResult]] = []
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        if exc_type is None:
+            self.send()
+
+    def _queue[T: CollmexRecord](
+        self, row: list[str], record_type: str, model: type[T]
+    ) -> BatchResult[T]:
+        if any(queued_type == record_type for _, queued_type, _, _ in self._pending):
+            raise ValueError(f"Batch already contains a query returning {record_type} records")
+        result: BatchResult[T] = BatchResult()
+        self._pending.append((row, record_type, model, result))
+        return result
+
+    def get_vendors(self, **kwargs: Any) -> BatchResult[Vendor]:
+        """Queue a vendor query (see CollmexClient.get_vendors)."""
+        return self._queue(self._client._vendors_query_row(**kwargs), "CMXLIF", Vendor)
+
+    def get_open_items(self, **kwargs: Any) -> BatchResult[OpenItem]:
+        """Queue an open items query (see CollmexClient.get_open_items)."""
+        return self._queue(self._client._open_items_query_row(**kwargs), "OPEN_ITEM", OpenItem)
+
+    def get_bookings(self, **kwargs: Any) -> BatchResult[AccountingDocument]:
+        """Queue a bookings query (see CollmexClient.get_bookings)."""
+        return self._queue(
+            self._client._bookings_query_row(**kwargs), "ACCDOC", AccountingDocument
+        )
+
+    def send(self) -> None:
+        """Send all queued queries in one request and resolve their results."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        results = self._client.api.request(
+            *[row for row, _, _, _ in pending],
+            cacheable=True,
+            keep=[record_type for _, record_type, _, _ in pending],
+        )
+
+        rows_by_type: dict[str, list[list[str]]] = {}
+        for r in results:
+            if r:
+                rows_by_type.setdefault(r[0], []).append(r)
 
-        # Filter to find entries without matching vendor/customer reference
-        # These are typically imported bank transactions without counter-bookings
-        unmatched = []
-        for booking in bookings:
-            # Bank transactions without vendor/customer assignment likely need matching
-            if booking.vendor_id is None and booking.customer_id is None:
-                # Also check if there's no invoice number
-                if not booking.invoice_number:
-                    unmatched.append(booking)
-
-        return unmatched
+        for _, record_type, model, result in pending:
+            result._records = [model.from_csv_row(r) for r in rows_by_type.get(record_type, [])]
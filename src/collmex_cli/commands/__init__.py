@@ -0,0 +1 @@
+"""CLI command groups, merged into the top-level app in main.py."""
@@ -0,0 +1,236 @@
+"""Open item and booking commands."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Annotated
+
+import typer
+
+from .common import (
+    NoCacheOption,
+    RefreshOption,
+    format_amount,
+    get_consoles,
+    handle_error,
+    output_json_stream,
+    output_table,
+    parse_iso_date,
+)
+
+app = typer.Typer()
+
+_ZERO = Decimal(0)
+
+
+# =============================================================================
+# Open Items Commands
+# =============================================================================
+
+
+@app.command("open-items")
+def list_open_items(
+    ctx: typer.Context,
+    vendor: Annotated[bool, typer.Option("--vendor", "-v", help="Show vendor open items")] = False,
+    customer: Annotated[bool, typer.Option("--customer", "-c", help="Show customer open items")] = True,
+    vendor_id: Annotated[int | None, typer.Option("--vendor-id", help="Filter by vendor ID")] = None,
+    customer_id: Annotated[int | None, typer.Option("--customer-id", help="Filter by customer ID")] = None,
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+    no_cache: NoCacheOption = False,
+    refresh: RefreshOption = False,
+) -> None:
+    """List open items (offene Posten) - unpaid invoices."""
+    from ..models import OPEN_ITEM_LIST_ADAPTER
+
+    console, _ = get_consoles()
+
+    try:
+        client = ctx.obj.query_client(no_cache, refresh)
+        # Default to vendor if --vendor flag is set
+        is_vendor = vendor or not customer
+        query = {"vendor": is_vendor, "vendor_id": vendor_id, "customer_id": customer_id}
+
+        if json_output:
+            output_json_stream(client.iter_open_items(**query), OPEN_ITEM_LIST_ADAPTER)
+        else:
+            item_type = "Vendor" if is_vendor else "Customer"
+            total = _ZERO
+            # The table only needs a few columns, so skip building models
+            items = client.project_open_items(
+                (
+                    "vendor_name" if is_vendor else "customer_name",
+                    "invoice_number",
+                    "document_date",
+                    "due_date",
+                    "days_overdue",
+                    "open_amount",
+                ),
+                **query,
+            )
+
+            def rows():
+                # Sum the open amounts in the same pass that fills the table
+                nonlocal total
+                for item in items:
+                    if item[-1] is not None:
+                        total += item[-1]
+                    yield item
+
+            count = output_table(
+                f"Open Items ({item_type})",
+                ["Name", "Invoice #", "Date", "Due", "Overdue", "Open Amount"],
+                rows(),
+            )
+            console.print(f"\n[dim]Total: {count} items, {format_amount(total)} EUR open[/dim]")
+    except Exception as e:
+        handle_error(e, json_output)
+
+
+# =============================================================================
+# Bookings Commands
+# =============================================================================
+
+
+@app.command("bookings")
+def list_bookings(
+    ctx: typer.Context,
+    account: Annotated[int | None, typer.Option("--account", "-a", help="Filter by account number")] = None,
+    vendor_id: Annotated[int | None, typer.Option("--vendor-id", help="Filter by vendor ID")] = None,
+    customer_id: Annotated[int | None, typer.Option("--customer-id", help="Filter by customer ID")] = None,
+    year: Annotated[int | None, typer.Option("--year", "-y", help="Fiscal year")] = None,
+    search: Annotated[str | None, typer.Option("--search", "-s", help="Search in booking text")] = None,
+    date_from: Annotated[
+        date | None,
+        typer.Option("--from", parser=parse_iso_date, metavar="YYYY-MM-DD", help="Start date (YYYY-MM-DD)"),
+    ] = None,
+    date_to: Annotated[
+        date | None,
+        typer.Option("--to", parser=parse_iso_date, metavar="YYYY-MM-DD", help="End date (YYYY-MM-DD)"),
+    ] = None,
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+    no_cache: NoCacheOption = False,
+    refresh: RefreshOption = False,
+) -> None:
+    """List accounting documents/bookings (Buchungen)."""
+    from ..models import ACCOUNTING_DOCUMENT_LIST_ADAPTER
+
+    console, _ = get_consoles()
+
+    try:
+        client = ctx.obj.query_client(no_cache, refresh)
+        query = {
+            "fiscal_year": year,
+            "account_number": account,
+            "vendor_id": vendor_id,
+            "customer_id": customer_id,
+            "text": search,
+            "date_from": date_from,
+            "date_to": date_to,
+        }
+
+        if json_output:
+            output_json_stream(client.iter_bookings(**query), ACCOUNTING_DOCUMENT_LIST_ADAPTER)
+        else:
+            # The table only needs a few columns, so skip building models
+            fields = ("booking_id", "document_date", "account_number", "debit_credit", "amount", "booking_text")
+            rows = (
+                (*values, text[:40])
+                for *values, text in client.project_bookings(fields, **query)
+            )
+            count = output_table(
+                "Bookings",
+                ["ID", "Date", "Account", "D/C", "Amount", "Text"],
+                rows,
+            )
+            console.print(f"\n[dim]Total: {count} bookings[/dim]")
+    except Exception as e:
+        handle_error(e, json_output)
+
+
+@app.command("unmatched")
+def list_unmatched(
+    ctx: typer.Context,
+    account: Annotated[int, typer.Option("--account", "-a", help="Bank account number")] = 1200,
+    accounts: Annotated[
+        str | None,
+        typer.Option("--accounts", help="Several bank accounts, comma-separated (e.g. 1200,1210)"),
+    ] = None,
+    year: Annotated[int | None, typer.Option("--year", "-y", help="Fiscal year")] = None,
+    date_from: Annotated[
+        date | None,
+        typer.Option("--from", parser=parse_iso_date, metavar="YYYY-MM-DD", help="Start date (YYYY-MM-DD)"),
+    ] = None,
+    date_to: Annotated[
+        date | None,
+        typer.Option("--to", parser=parse_iso_date, metavar="YYYY-MM-DD", help="End date (YYYY-MM-DD)"),
+    ] = None,
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+    no_cache: NoCacheOption = False,
+    refresh: RefreshOption = False,
+) -> None:
+    """List unmatched bank transactions (missing receipts/invoices).
+
+    Shows bank account entries that don't have a matching vendor or customer invoice.
+    These are typically entries that need a receipt to be uploaded.
+
+    With --accounts, the accounts are queried concurrently and listed together.
+    """
+    from ..models import ACCOUNTING_DOCUMENT_LIST_ADAPTER
+
+    console, _ = get_consoles()
+
+    try:
+        bank_accounts = _parse_accounts(accounts) if accounts else [account]
+
+        client = ctx.obj.query_client(no_cache, refresh)
+        if len(bank_accounts) == 1:
+            unmatched = client.get_unmatched_bank_transactions(
+                bank_account=bank_accounts[0],
+                fiscal_year=year,
+                date_from=date_from,
+                date_to=date_to,
+            )
+        else:
+            per_account = client.get_unmatched_bank_transactions_multi(
+                bank_accounts,
+                fiscal_year=year,
+                date_from=date_from,
+                date_to=date_to,
+            )
+            unmatched = [b for a in bank_accounts for b in per_account[a]]
+
+        if json_output:
+            output_json_stream(unmatched, ACCOUNTING_DOCUMENT_LIST_ADAPTER)
+        else:
+            columns = ["ID", "Date", "D/C", "Amount", "Text"]
+            rows = (
+                (
+                    b.booking_id,
+                    b.document_date,
+                    b.debit_credit,
+                    b.amount,
+                    b.booking_text[:50],
+                )
+                for b in unmatched
+            )
+            if len(bank_accounts) == 1:
+                title = f"Unmatched Bank Transactions (Account {bank_accounts[0]})"
+            else:
+                title = f"Unmatched Bank Transactions (Accounts {', '.join(map(str, bank_accounts))})"
+                columns.insert(0, "Account")
+                rows = ((b.account_number, *row) for b, row in zip(unmatched, rows))
+            count = output_table(title, columns, rows)
+            console.print(f"\n[dim]Total: {count} unmatched transactions[/dim]")
+            console.print("[yellow]These entries need receipts/invoices to be matched.[/yellow]")
+    except Exception as e:
+        handle_error(e, json_output)
+
+
+def _parse_accounts(value: str) -> list[int]:
+    """Parse a comma-separated list of account numbers (duplicates dropped)."""
+    try:
+        accounts = [int(a) for a in value.split(",") if a.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid account list: {value} (expected e.g. 1200,1210)") from None
+    if not accounts:
+        raise ValueError("No account numbers given")
+    return list(dict.fromkeys(accounts))
@@ -0,0 +1,239 @@
+"""Shared helpers for the CLI commands: consoles, output, option parsing, client state."""
+
+import itertools
+import sys
+from collections.abc import Iterable, Sequence
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated
+
+import orjson
+import typer
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+    from rich.console import Console
+
+    from ..client import CollmexClient
+
+# rich, pydantic and the API client are imported inside the functions that use
+# them, so --version, --help and shell completion start up fast.
+
+
+@lru_cache(maxsize=1)
+def get_consoles() -> tuple["Console", "Console"]:
+    """Create the stdout and stderr consoles on first use.
+
+    Auto-highlighting and emoji codes are off: all output is styled with
+    explicit markup, so rich's regex passes over every string are wasted.
+    """
+    from rich.console import Console
+
+    options = {"highlight": False, "emoji": False, "log_time": False, "log_path": False}
+    return Console(**options), Console(stderr=True, **options)
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> "CollmexClient":
+    """Create the CollmexClient shared by all commands run in this process."""
+    from ..client import CollmexClient
+
+    return CollmexClient()
+
+
+class CliState:
+    """Command context object (ctx.obj), giving commands the shared client."""
+
+    @property
+    def client(self) -> "CollmexClient":
+        """Shared CollmexClient, created on first use."""
+        return _get_client()
+
+    def query_client(self, no_cache: bool = False, refresh: bool = False) -> "CollmexClient":
+        """Shared client with the --no-cache/--refresh options applied to its cache."""
+        client = self.client
+        client.api.use_cache = not no_cache
+        client.api.refresh_cache = refresh
+        return client
+
+    def close(self) -> None:
+        """Release per-invocation connections; the client stays reusable."""
+        if _get_client.cache_info().currsize:
+            client = _get_client()
+            # Cache options only apply to the command that set them
+            client.api.use_cache = True
+            client.api.refresh_cache = False
+            client.close()
+
+
+NoCacheOption = Annotated[
+    bool, typer.Option("--no-cache", help="Neither use nor store cached responses")
+]
+RefreshOption = Annotated[
+    bool, typer.Option("--refresh", help="Ignore cached responses and fetch fresh data")
+]
+
+
+def json_serial(obj):
+    """JSON serializer for objects orjson can't serialize natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def output_json(data: list | dict) -> None:
+    """Output data as JSON (LLM-friendly format)."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(
+        orjson.dumps(data, default=json_serial, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    sys.stdout.buffer.flush()
+
+
+# Records serialized per step by output_json_stream()
+JSON_STREAM_BATCH_SIZE = 500
+
+
+def output_json_stream(records: Iterable, adapter: "TypeAdapter") -> None:
+    """Output records as a JSON array, serializing a batch at a time.
+
+    Writes the same document as output_json() on the dumped list, but only
+    one batch of dumped records and its JSON text are held in memory.
+
+    Records are parsed as they are consumed, so a record may fail after
+    earlier batches were written. The array is still closed, keeping stdout
+    valid JSON, but it is only complete if the command exits with status 0.
+    A failure in the first batch writes nothing.
+
+    Args:
+        records: Records to output (consumed lazily)
+        adapter: TypeAdapter for a list of the record type
+    """
+    write = sys.stdout.buffer.write
+    sys.stdout.flush()
+    separator = b"["
+    try:
+        for batch in itertools.batched(records, JSON_STREAM_BATCH_SIZE):
+            # pydantic-core serializes the models straight to JSON bytes
+            chunk = adapter.dump_json(list(batch), indent=2)
+            # Drop the batch's own "[" and "\n]" so batches join into one array
+            write(separator + chunk[1:-2])
+            separator = b","
+    finally:
+        if separator == b",":
+            write(b"\n]\n")
+        sys.stdout.buffer.flush()
+    if separator == b"[":
+        write(b"[]\n")
+        sys.stdout.buffer.flush()
+
+
+def parse_optional_date(value: str | None) -> date | None:
+    """Parse an optional YYYY-MM-DD value."""
+    return date.fromisoformat(value) if value else None
+
+
+def parse_iso_date(value: str) -> date:
+    """Typer parser for YYYY-MM-DD options.
+
+    Used as typer.Option(parser=parse_iso_date), so a bad date is reported
+    as a usage error before any request is made.
+    """
+    return date.fromisoformat(value)
+
+
+def parse_decimal(value: str) -> Decimal:
+    """Typer parser for numeric options, exact (no float round-trip).
+
+    Used as typer.Option(parser=parse_decimal), so a bad number is reported
+    as a usage error. A decimal comma ("12,5") is accepted, as in import
+    files. Exponent notation ("1e2") is rejected: the Decimal would keep it,
+    and JSON output and messages would show "1E+2" instead of a plain amount.
+    """
+    try:
+        result = Decimal(value.replace(",", "."))
+    except InvalidOperation:
+        raise ValueError(f"Invalid number: {value!r}") from None
+    if not result.is_finite() or "e" in value.lower():
+        raise ValueError(f"Invalid number: {value!r}")
+    return result
+
+
+def output_table(title: str, columns: list[str], rows: Iterable[Sequence]) -> int:
+    """Output data as a rich table.
+
+    Args:
+        title: Table title
+        columns: Column headers
+        rows: Rows to show (consumed lazily, e.g. a generator)
+
+    Returns:
+        Number of rows shown
+    """
+    from rich.table import Table
+
+    console, _ = get_consoles()
+    table = Table(title=title)
+    for col in columns:
+        table.add_column(col)
+    add_row = table.add_row
+    for row in rows:
+        add_row(*map(_format_cell, row))
+    console.print(table)
+    return table.row_count
+
+
+def _format_cell(value: object) -> str:
+    """Render a table cell value (None as empty)."""
+    if value is None:
+        return ""
+    if type(value) is str:
+        return value
+    return format_amount(value) if type(value) is Decimal else str(value)
+
+
+def format_amount(value: Decimal) -> str:
+    """Format a Decimal for display, never in exponent notation.
+
+    Like format_collmex_decimal(), but keeps the decimal point: str() is the
+    fast path and only falls back to fixed-point formatting for values such
+    as Decimal("1E+2").
+    """
+    text = str(value)
+    return format(value, "f") if "E" in text else text
+
+
+def handle_error(e: Exception, json_output: bool = False) -> None:
+    """Handle and display errors, then exit with status 1.
+
+    Args:
+        e: The error
+        json_output: Write the error to stderr as a JSON object (status, type,
+            message and, for Collmex errors, error_code) instead of rich text
+    """
+    if json_output:
+        error = {"status": "error", "type": type(e).__name__, "message": str(e)}
+        if error_code := getattr(e, "error_code", None):
+            error["error_code"] = error_code
+        sys.stderr.flush()
+        sys.stderr.buffer.write(orjson.dumps(error, option=orjson.OPT_APPEND_NEWLINE))
+        sys.stderr.buffer.flush()
+        raise typer.Exit(1)
+
+    from pydantic import ValidationError
+
+    from ..api import CollmexAuthError, CollmexError
+
+    _, err_console = get_consoles()
+    if isinstance(e, CollmexAuthError):
+        err_console.print(f"[red]Authentication failed:[/red] {e}")
+        err_console.print("Check your COLLMEX_* environment variables")
+    elif isinstance(e, CollmexError):
+        err_console.print(f"[red]Collmex API error:[/red] {e}")
+    elif isinstance(e, ValidationError):
+        err_console.print(f"[red]Configuration error:[/red] {e}")
+        err_console.print("Ensure COLLMEX_CUSTOMER_ID, COLLMEX_USERNAME, COLLMEX_PASSWORD are set")
+    else:
+        err_console.print(f"[red]Error:[/red] {e}")
+    raise typer.Exit(1)
@@ -0,0 +1,234 @@
+"""Vendor invoice commands: booking and emailing invoices."""
+
+import csv
+import json
+from collections.abc import Iterator
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+from .common import (
+    format_amount,
+    get_consoles,
+    handle_error,
+    output_json,
+    parse_decimal,
+    parse_iso_date,
+    parse_optional_date,
+)
+
+app = typer.Typer()
+
+# VendorInvoice amount fields, parsed from import files with parse_collmex_decimal()
+_AMOUNT_FIELDS = ("net_amount_full_tax", "tax_full", "net_amount_reduced_tax", "tax_reduced", "other_amount")
+
+
+# =============================================================================
+# Vendor Invoice Commands
+# =============================================================================
+
+
+@app.command("vendor-invoice")
+def create_vendor_invoice(
+    ctx: typer.Context,
+    vendor_id: Annotated[int, typer.Option("--vendor-id", "-v", help="Vendor ID")],
+    invoice_number: Annotated[str, typer.Option("--invoice", "-i", help="Invoice number")],
+    invoice_date: Annotated[
+        date,
+        typer.Option("--date", "-d", parser=parse_iso_date, metavar="YYYY-MM-DD", help="Invoice date (YYYY-MM-DD)"),
+    ],
+    net_amount: Annotated[
+        Decimal,
+        typer.Option("--net", "-n", parser=parse_decimal, metavar="AMOUNT", help="Net amount (full VAT rate)"),
+    ],
+    booking_text: Annotated[str | None, typer.Option("--text", "-t", help="Booking text")] = None,
+    tax_amount: Annotated[
+        Decimal | None,
+        typer.Option("--tax", parser=parse_decimal, metavar="AMOUNT", help="Tax amount (auto-calculated if empty)"),
+    ] = None,
+    account: Annotated[int | None, typer.Option("--account", "-a", help="Expense account (default: 3200)")] = None,
+    cost_center: Annotated[str | None, typer.Option("--cost-center", help="Cost center")] = None,
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+) -> None:
+    """Create a vendor invoice (Lieferantenrechnung).
+
+    Books an expense in accounting with the specified vendor.
+    """
+    from ..models import VendorInvoice
+
+    console, _ = get_consoles()
+
+    try:
+        invoice = VendorInvoice(
+            vendor_id=vendor_id,
+            invoice_number=invoice_number,
+            invoice_date=invoice_date,
+            net_amount_full_tax=net_amount,
+            tax_full=tax_amount or None,  # zero means auto-calculate
+            booking_text=booking_text or "",
+            account_full_tax=account,
+            cost_center=cost_center or "",
+        )
+
+        client = ctx.obj.client
+        result = client.create_vendor_invoice(invoice)
+
+        if json_output:
+            output_json({"status": "created", "invoice": invoice.model_dump(), "response": result})
+        else:
+            console.print("[green]Vendor invoice created successfully[/green]")
+            console.print(f"Vendor: {vendor_id}")
+            console.print(f"Invoice: {invoice_number}")
+            console.print(f"Amount: {format_amount(net_amount)} EUR (net)")
+    except Exception as e:
+        handle_error(e, json_output)
+
+
+@app.command("vendor-invoices-import")
+def import_vendor_invoices(
+    ctx: typer.Context,
+    path: Annotated[str, typer.Argument(help="CSV file (with header row) or JSONL file of invoices")],
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+) -> None:
+    """Create many vendor invoices from a file in a single API request.
+
+    Columns (CSV) or keys (JSONL) are VendorInvoice field names, e.g.
+    vendor_id, invoice_number, invoice_date (YYYY-MM-DD), net_amount_full_tax,
+    booking_text. Empty values are left unset; amounts may use a decimal comma.
+    """
+    from ..api import CollmexError
+    from ..models import VendorInvoice
+
+    console, err_console = get_consoles()
+
+    try:
+        invoices = [VendorInvoice(**fields) for fields in _read_invoice_rows(Path(path))]
+        if not invoices:
+            raise ValueError(f"No invoices found in {path}")
+
+        client = ctx.obj.client
+        try:
+            result = client.create_vendor_invoices_batch(invoices)
+        except CollmexError as e:
+            # Line 1 of the request is LOGIN, so line n is invoice n - 1
+            if e.line is not None and 2 <= e.line <= len(invoices) + 1:
+                invoice = invoices[e.line - 2]
+                err_console.print(
+                    f"[red]Invoice {e.line - 1} ({invoice.invoice_number}) was rejected[/red]"
+                )
+            raise
+
+        if json_output:
+            output_json({"status": "created", "count": len(invoices), "response": result})
+        else:
+            console.print(f"[green]{len(invoices)} vendor invoices created successfully[/green]")
+    except Exception as e:
+        handle_error(e, json_output)
+
+
+def _read_invoice_rows(path: Path) -> Iterator[dict[str, Any]]:
+    """Read invoice field dicts from a CSV or JSONL (.jsonl/.ndjson) file.
+
+    Raises:
+        ValueError: If a line is malformed; the message names the line
+    """
+    with path.open(encoding="utf-8", newline="") as f:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            rows = ((n, line) for n, line in enumerate(f, start=1) if line.strip())
+        else:
+            reader = csv.DictReader(f)
+            # line_num is read after each row, i.e. the row's (last) line
+            rows = ((reader.line_num, row) for row in reader)
+        for line_num, row in rows:
+            try:
+                if isinstance(row, str):
+                    row = json.loads(row, parse_float=Decimal, parse_constant=Decimal)
+                fields = _invoice_fields(row)
+            except ValueError as e:
+                raise ValueError(f"{path.name}, line {line_num}: {e}") from None
+            yield fields
+
+
+def _invoice_fields(row: Any) -> dict[str, Any]:
+    """Convert one parsed CSV/JSONL row into VendorInvoice keyword arguments."""
+    from ..models import parse_collmex_decimal
+
+    if not isinstance(row, dict):
+        raise ValueError(f"Expected an object of invoice fields, got {type(row).__name__}")
+    if None in row:
+        # csv.DictReader collects cells beyond the header under the key None
+        raise ValueError("More values than header columns")
+
+    fields = {k: v for k, v in row.items() if v not in ("", None)}
+    if isinstance(fields.get("invoice_date"), str):
+        fields["invoice_date"] = parse_optional_date(fields["invoice_date"])
+    # Amounts go straight from text to Decimal, never through float
+    for name in _AMOUNT_FIELDS:
+        amount = fields.get(name)
+        if isinstance(amount, str):
+            try:
+                amount = parse_collmex_decimal(amount)
+            except InvalidOperation:
+                raise ValueError(f"Invalid {name}: {fields[name]!r}") from None
+        if isinstance(amount, Decimal):
+            # NaN/Infinity are rejected like in parse_decimal()
+            if not amount.is_finite():
+                raise ValueError(f"Invalid {name}: {fields[name]!r}")
+            fields[name] = amount
+    return fields
+
+
+@app.command("invoice-send")
+def send_invoice(
+    pdf: Annotated[str, typer.Argument(help="Path to PDF file to send")],
+    xml: Annotated[str | None, typer.Option("--xml", "-x", help="Path to ZUGFeRD XML file (optional)")] = None,
+    recipient: Annotated[str | None, typer.Option("--to", help="Recipient email (defaults to COLLMEX_ACCOUNTING_EMAIL)")] = None,
+    subject: Annotated[str | None, typer.Option("--subject", "-s", help="Email subject")] = None,
+    body: Annotated[str | None, typer.Option("--body", "-b", help="Email body text")] = None,
+) -> None:
+    """Send vendor invoice PDF (with optional ZUGFeRD XML) to accounting.
+
+    The PDF will be sent to the configured accounting email address.
+    If a ZUGFeRD XML is provided, it will be attached for automatic import.
+
+    Requires SMTP configuration via environment variables:
+    - COLLMEX_SMTP_HOST, COLLMEX_SMTP_USER, COLLMEX_SMTP_PASSWORD, COLLMEX_SMTP_FROM
+    - COLLMEX_ACCOUNTING_EMAIL (optional, can override with --to)
+    """
+    # Lazy: smtplib and the email package are only needed here
+    from ..email import send_invoice_email
+
+    console, err_console = get_consoles()
+
+    try:
+        # Read XML content if provided
+        xml_content = None
+        if xml:
+            xml_path = Path(xml)
+            if not xml_path.exists():
+                err_console.print(f"[red]XML file not found: {xml}[/red]")
+                raise typer.Exit(1)
+            xml_content = xml_path.read_text(encoding="utf-8")
+
+        send_invoice_email(
+            pdf_path=pdf,
+            xml_content=xml_content,
+            recipient=recipient,
+            subject=subject,
+            body=body,
+        )
+
+        console.print("[green]Invoice sent successfully![/green]")
+        if recipient:
+            console.print(f"Recipient: {recipient}")
+        else:
+            console.print("Recipient: (from COLLMEX_ACCOUNTING_EMAIL)")
+        console.print(f"PDF: {pdf}")
+        if xml:
+            console.print(f"XML: {xml}")
+
+    except Exception as e:
+        handle_error(e)
@@ -0,0 +1,70 @@
+"""Utility commands."""
+
+import typer
+
+from .common import get_consoles, handle_error
+
+app = typer.Typer()
+
+
+# =============================================================================
+# Utility Commands
+# =============================================================================
+
+
+@app.command("test")
+def test_connection(ctx: typer.Context) -> None:
+    """Test the Collmex API connection."""
+    console, _ = get_consoles()
+
+    try:
+        client = ctx.obj.client
+        # Try to fetch vendors as a simple test
+        vendors = client.get_vendors()
+        console.print("[green]Connection successful![/green]")
+        console.print(f"Found {len(vendors)} vendors in your account.")
+    except Exception as e:
+        handle_error(e)
+
+
+@app.command("shell")
+def shell(ctx: typer.Context) -> None:
+    """Run several commands in one session over a single API connection.
+
+    Enter commands without the leading "collmex", e.g. "bookings --year 2024".
+    The HTTP connection (and its TLS session) and the response cache are kept
+    between commands. "exit", "quit" or Ctrl-D ends the session.
+    """
+    import shlex
+
+    # The root app, to dispatch the entered commands
+    from ..main import app as root_app
+
+    console, err_console = get_consoles()
+
+    while True:
+        try:
+            line = input("collmex> ")
+        except EOFError:
+            console.print()
+            break
+        except KeyboardInterrupt:
+            console.print()
+            continue
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            err_console.print(f"[red]Error:[/red] {e}")
+            continue
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+
+        try:
+            # ctx.obj carries the shared client into the command; usage errors
+            # are reported as on the command line, which ends in SystemExit
+            root_app(args, prog_name="collmex", obj=ctx.obj)
+        except SystemExit:
+            pass
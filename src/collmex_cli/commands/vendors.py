@@ -0,0 +1,148 @@
+"""Vendor commands: listing, creating and matching vendors."""
+
+from typing import Annotated
+
+import typer
+
+from .common import (
+    NoCacheOption,
+    RefreshOption,
+    get_consoles,
+    handle_error,
+    output_json,
+    output_json_stream,
+    output_table,
+)
+
+app = typer.Typer()
+
+
+# =============================================================================
+# Vendors Commands
+# =============================================================================
+
+
+@app.command("vendors")
+def list_vendors(
+    ctx: typer.Context,
+    vendor_id: Annotated[int | None, typer.Option("--id", help="Filter by vendor ID")] = None,
+    search: Annotated[str | None, typer.Option("--search", "-s", help="Search text")] = None,
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+    no_cache: NoCacheOption = False,
+    refresh: RefreshOption = False,
+) -> None:
+    """List vendors (Lieferanten)."""
+    from ..models import VENDOR_LIST_ADAPTER
+
+    console, _ = get_consoles()
+
+    try:
+        client = ctx.obj.query_client(no_cache, refresh)
+
+        if json_output:
+            vendors = client.iter_vendors(vendor_id=vendor_id, text=search)
+            output_json_stream(vendors, VENDOR_LIST_ADAPTER)
+        else:
+            from ..models import Vendor
+
+            # The table only needs a few columns, so skip building models
+            fields = ("vendor_id", "company_name", "first_name", "last_name", "city", "email")
+            rows = (
+                (vid, Vendor.format_display_name(company, first, last), city, email)
+                for vid, company, first, last, city, email in client.project_vendors(
+                    fields, vendor_id=vendor_id, text=search
+                )
+            )
+            count = output_table("Vendors", ["ID", "Name", "City", "Email"], rows)
+            console.print(f"\n[dim]Total: {count} vendors[/dim]")
+    except Exception as e:
+        handle_error(e, json_output)
+
+
+@app.command("vendor-create")
+def create_vendor(
+    ctx: typer.Context,
+    company_name: Annotated[str, typer.Option("--company", "-c", help="Company name")],
+    street: Annotated[str | None, typer.Option("--street", help="Street address")] = None,
+    postal_code: Annotated[str | None, typer.Option("--zip", help="Postal code")] = None,
+    city: Annotated[str | None, typer.Option("--city", help="City")] = None,
+    country: Annotated[str, typer.Option("--country", help="Country code")] = "DE",
+    email: Annotated[str | None, typer.Option("--email", help="Email address")] = None,
+    iban: Annotated[str | None, typer.Option("--iban", help="IBAN")] = None,
+    vat_id: Annotated[str | None, typer.Option("--vat-id", help="VAT ID (USt-IdNr)")] = None,
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
+) -> None:
+    """Create a new vendor (Lieferant)."""
+    from ..models import Vendor
+
+    console, _ = get_consoles()
+
+    try:
+        vendor = Vendor(
+            company_name=company_name,
+            street=street or "",
+            postal_code=postal_code or "",
+            city=city or "",
+            country=country,
+            email=email or "",
+            iban=iban or "",
+            vat_id=vat_id or "",
+        )
+
+        client = ctx.obj.client
+        result = client.create_vendor(vendor)
+
+        if json_output:
+            output_json({"status": "created", "response": result})
+        else:
+            console.print("[green]Vendor created successfully[/green]")
+            console.print(f"Response: {result}")
+    except Exception as e:
+        handle_error(e, json_output)
+
+
+@app.command("vendor-match")
+def match_vendor(
+    ctx: typer.Context,
+    iban: Annotated[str | None, typer.Option("--iban", help="IBAN to match")] = None,
+    vat_id: Annotated[str | None, typer.Option("--vat-id", help="VAT ID (USt-IdNr) to match")] = None,
+    name: Annotated[str | None, typer.Option("--name", "-n", help="Company name to match")] = None,
+    json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = True,
+) -> None:
+    """Match a vendor by IBAN, VAT ID, or name.
+
+    Matching priority:
+    1. IBAN (exact match)
+    2. VAT ID (exact match)
+    3. Name (fuzzy match)
+
+    Returns match result with vendor_id if found.
+    """
+    console, err_console = get_consoles()
+
+    if not any([iban, vat_id, name]):
+        err_console.print("[red]Error:[/red] At least one of --iban, --vat-id, or --name required")
+        raise typer.Exit(1)
+
+    try:
+        client = ctx.obj.client
+        result = client.match_vendor(iban=iban, vat_id=vat_id, name=name)
+
+        if json_output:
+            output_json(result)
+        else:
+            match_type = result.get("match")
+            if match_type == "exact":
+                console.print("[green]Exact match found![/green]")
+                console.print(f"Match field: {result.get('match_field')}")
+                console.print(f"Vendor ID: {result.get('vendor_id')}")
+                vendor = result.get("vendor", {})
+                console.print(f"Name: {vendor.get('company_name', '')}")
+            elif match_type == "fuzzy":
+                console.print("[yellow]Fuzzy matches found:[/yellow]")
+                for c in result.get("candidates", []):
+                    console.print(f"  [{c['score']}] ID {c['vendor_id']}: {c['name']}")
+            else:
+                console.print("[red]No match found[/red]")
+    except Exception as e:
+        handle_error(e, json_output)
@@ -0,0 +1,104 @@
+"""ZUGFeRD commands."""
+
+import sys
+from datetime import date
+from decimal import Decimal
+from typing import Annotated
+
+import typer
+
+from .common import get_consoles, handle_error, parse_decimal, parse_iso_date
+
+app = typer.Typer()
+
+
+# =============================================================================
+# ZUGFeRD Commands
+# =============================================================================
+
+
+@app.command("zugferd-create")
+def create_zugferd(
+    ctx: typer.Context,
+    vendor_id: Annotated[int, typer.Option("--vendor-id", "-v", help="Vendor ID from Collmex")],
+    invoice_number: Annotated[str, typer.Option("--invoice", "-i", help="Invoice number")],
+    invoice_date: Annotated[
+        date,
+        typer.Option("--date", "-d", parser=parse_iso_date, metavar="YYYY-MM-DD", help="Invoice date (YYYY-MM-DD)"),
+    ],
+    description: Annotated[str, typer.Option("--desc", help="Line item description")],
+    net_amount: Annotated[
+        Decimal, typer.Option("--net", "-n", parser=parse_decimal, metavar="AMOUNT", help="Net amount")
+    ],
+    tax_rate: Annotated[
+        Decimal, typer.Option("--tax-rate", parser=parse_decimal, metavar="RATE", help="Tax rate (e.g., 19.0)")
+    ] = "19.0",
+    quantity: Annotated[
+        Decimal, typer.Option("--qty", parser=parse_decimal, metavar="QTY", help="Quantity")
+    ] = "1",
+    output: Annotated[str | None, typer.Option("--output", "-o", help="Output file path")] = None,
+    buyer_id: Annotated[str | None, typer.Option("--buyer-id", help="Your customer ID at the vendor")] = None,
+    due_date: Annotated[
+        date | None,
+        typer.Option("--due", parser=parse_iso_date, metavar="YYYY-MM-DD", help="Payment due date (YYYY-MM-DD)"),
+    ] = None,
+    notes: Annotated[str | None, typer.Option("--notes", help="Additional notes")] = None,
+    no_validate: Annotated[
+        bool, typer.Option("--no-validate", help="Skip EN 16931 schema validation of the XML")
+    ] = False,
+) -> None:
+    """Generate a ZUGFeRD XML for a vendor invoice.
+
+    Fetches vendor data from Collmex and generates an EN 16931 compliant XML.
+    Buyer data is taken from COLLMEX_BUYER_* environment variables.
+    """
+    # Lazy: drafthorse pulls in lxml and the XML schemas
+    from ..zugferd import create_zugferd_xml, save_zugferd_xml
+
+    console, err_console = get_consoles()
+
+    try:
+        # Fetch vendor from Collmex
+        client = ctx.obj.client
+        vendors = client.get_vendors(vendor_id=vendor_id)
+
+        if not vendors:
+            err_console.print(f"[red]Vendor {vendor_id} not found[/red]")
+            raise typer.Exit(1)
+
+        vendor = vendors[0]
+
+        # Create line items
+        line_items = [
+            {
+                "description": description,
+                "quantity": quantity,
+                "unit_price": net_amount / quantity,
+                "tax_rate": tax_rate,
+                "unit": "C62",  # pieces
+            }
+        ]
+
+        # Generate XML
+        xml_content = create_zugferd_xml(
+            vendor=vendor,
+            invoice_number=invoice_number,
+            invoice_date=invoice_date,
+            line_items=line_items,
+            buyer_customer_id=buyer_id,
+            due_date=due_date,
+            notes=notes,
+            validate=not no_validate,
+        )
+
+        # Output
+        if output:
+            save_zugferd_xml(xml_content, output)
+            console.print(f"[green]ZUGFeRD XML saved to {output}[/green]")
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(xml_content if xml_content.endswith(b"\n") else xml_content + b"\n")
+            sys.stdout.buffer.flush()
+
+    except Exception as e:
+        handle_error(e)
@@ -1,6 +1,9 @@
 """Configuration management for Collmex CLI."""
 
-from pydantic import Field
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import AliasGenerator, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,7 +11,8 @@ class CollmexConfig(BaseSettings):
     """Collmex API and related configuration.
 
     Configuration is loaded from environment variables with COLLMEX_ prefix,
-    or from a .env file in the current directory.
+    or from a .env file in the current directory. Variable names are
+    case-sensitive and must be uppercase.
 
     Required environment variables:
         COLLMEX_CUSTOMER_ID: Your Collmex customer ID
@@ -16,6 +20,10 @@ class CollmexConfig(BaseSettings):
         COLLMEX_USERNAME: Your Collmex username
         COLLMEX_PASSWORD: Your Collmex password
 
+    Optional - Caching:
+        COLLMEX_CACHE_TTL: Seconds to reuse identical query responses (default: 60, 0 disables)
+        COLLMEX_CACHE_DIR: Directory to persist cached responses across runs (default: off)
+
     Optional - SMTP (for sending invoices):
         COLLMEX_SMTP_HOST: SMTP server hostname
         COLLMEX_SMTP_PORT: SMTP server port (default: 587)
@@ -34,11 +42,17 @@ class CollmexConfig(BaseSettings):
         COLLMEX_BUYER_EMAIL: Contact email
     """
 
+    # Env names are looked up verbatim (COLLMEX_ + upper-cased field name) instead
+    # of case-folding the whole environment; populate_by_name keeps keyword
+    # construction by field name working.
     model_config = SettingsConfigDict(
         env_prefix="COLLMEX_",
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        case_sensitive=True,
+        alias_generator=AliasGenerator(validation_alias=lambda name: f"COLLMEX_{name.upper()}"),
+        populate_by_name=True,
     )
 
     # ==========================================================================
@@ -49,6 +63,16 @@ class CollmexConfig(BaseSettings):
     username: str = Field(description="Collmex username")
     password: str = Field(description="Collmex password")
 
+    # ==========================================================================
+    # Caching (optional)
+    # ==========================================================================
+    cache_ttl: float = Field(
+        default=60.0, description="Seconds to reuse identical query responses (0 disables)"
+    )
+    cache_dir: Path | None = Field(
+        default=None, description="Directory to persist cached responses across runs"
+    )
+
     # ==========================================================================
     # SMTP configuration (optional, for invoice-send)
     # ==========================================================================
@@ -89,6 +113,11 @@ class CollmexConfig(BaseSettings):
         return all([self.buyer_name, self.buyer_street, self.buyer_zip, self.buyer_city])
 
 
+@lru_cache(maxsize=1)
 def get_config() -> CollmexConfig:
-    """Load and return the Collmex configuration."""
+    """Load and return the Collmex configuration.
+
+    The environment and .env file are read once per process; call
+    get_config.cache_clear() to pick up changed variables.
+    """
     return CollmexConfig()
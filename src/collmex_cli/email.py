@@ -1,13 +1,131 @@
 """Email sending for vendor invoices."""
 
+import atexit
+import base64
 import smtplib
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from email.message import EmailMessage, MIMEPart
 from pathlib import Path
 
 from .config import CollmexConfig, get_config
 
+# Logged-in SMTP connection per thread, reused across sends
+_local = threading.local()
+
+# Default message body, shared by every send
+_BODY_TEMPLATE = (
+    "Anbei die Rechnung {name} zur Verbuchung.\n\n"
+    "Diese E-Mail wurde automatisch generiert."
+)
+
+# Read size for attachments: a multiple of 57 bytes so every chunk encodes
+# to whole 76-character base64 lines
+_ATTACHMENT_CHUNK_SIZE = 57 * 1150
+
+# Files up to this size are read and encoded in one call
+_ATTACHMENT_READ_ALL_LIMIT = 8 * 1024 * 1024
+
+
+def _pdf_attachment(pdf_path: Path) -> MIMEPart:
+    """Build a base64 PDF part.
+
+    Typical invoices are read and encoded in one call. Large files (scans)
+    are encoded chunk by chunk, so only the encoded payload is kept in
+    memory, never the raw file contents alongside it.
+    """
+    part = MIMEPart()
+    part["Content-Type"] = "application/pdf"
+    if pdf_path.stat().st_size <= _ATTACHMENT_READ_ALL_LIMIT:
+        payload = base64.encodebytes(pdf_path.read_bytes()).decode("ascii")
+    else:
+        with open(pdf_path, "rb") as f:
+            payload = "".join(
+                base64.encodebytes(chunk).decode("ascii")
+                for chunk in iter(lambda: f.read(_ATTACHMENT_CHUNK_SIZE), b"")
+            )
+    part.set_payload(payload)
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", "attachment", filename=pdf_path.name)
+    return part
+
+
+def _require_smtp(config: CollmexConfig) -> None:
+    """Raise if SMTP is not configured."""
+    if not config.smtp_configured:
+        raise ValueError(
+            "SMTP not configured. Set COLLMEX_SMTP_HOST, COLLMEX_SMTP_USER, "
+            "COLLMEX_SMTP_PASSWORD, COLLMEX_SMTP_FROM"
+        )
+
+
+def _connect(config: CollmexConfig) -> smtplib.SMTP:
+    """Open a logged-in SMTP connection."""
+    server = smtplib.SMTP(config.smtp_host, config.smtp_port)
+    try:
+        if config.smtp_use_tls:
+            server.starttls()
+        server.login(config.smtp_user, config.smtp_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _is_alive(server: smtplib.SMTP) -> bool:
+    """Check a cached connection with NOOP before reusing it."""
+    try:
+        return server.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+def _discard_session() -> None:
+    """Close and forget this thread's cached connection."""
+    server = getattr(_local, "server", None)
+    _local.server = None
+    if server is not None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+atexit.register(_discard_session)
+
+
+@contextmanager
+def smtp_session(config: CollmexConfig | None = None) -> Iterator[smtplib.SMTP]:
+    """Yield a logged-in SMTP connection, reusing this thread's open one.
+
+    STARTTLS and LOGIN only happen when there is no healthy cached
+    connection for the configured server. A connection that raises an
+    SMTP error is dropped so the next session reconnects.
+
+    Args:
+        config: Optional config, loads from env if not provided
+
+    Raises:
+        ValueError: If SMTP is not configured
+    """
+    config = config or get_config()
+    _require_smtp(config)
+
+    key = (config.smtp_host, config.smtp_port, config.smtp_user)
+    server = getattr(_local, "server", None)
+    if server is None or getattr(_local, "key", None) != key or not _is_alive(server):
+        _discard_session()
+        server = _connect(config)
+        _local.server = server
+        _local.key = key
+
+    try:
+        yield server
+    except (smtplib.SMTPException, OSError):
+        _discard_session()
+        raise
+
 
 def send_invoice_email(
     pdf_path: Path | str,
@@ -16,6 +134,7 @@ def send_invoice_email(
     subject: str | None = None,
     body: str | None = None,
     config: CollmexConfig | None = None,
+    server: smtplib.SMTP | None = None,
 ) -> None:
     """Send vendor invoice PDF (with optional ZUGFeRD XML) via email.
 
@@ -26,18 +145,15 @@ def send_invoice_email(
         subject: Email subject (defaults to filename)
         body: Email body text
         config: Optional config, loads from env if not provided
+        server: Logged-in SMTP connection to use (see smtp_session); by
+            default this thread's cached session is used
 
     Raises:
         ValueError: If SMTP is not configured or recipient not provided
         FileNotFoundError: If PDF file doesn't exist
     """
     config = config or get_config()
-
-    if not config.smtp_configured:
-        raise ValueError(
-            "SMTP not configured. Set COLLMEX_SMTP_HOST, COLLMEX_SMTP_USER, "
-            "COLLMEX_SMTP_PASSWORD, COLLMEX_SMTP_FROM"
-        )
+    _require_smtp(config)
 
     recipient = recipient or config.accounting_email
     if not recipient:
@@ -50,41 +166,32 @@ def send_invoice_email(
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
     # Create message
-    msg = MIMEMultipart()
+    msg = EmailMessage()
     msg["From"] = config.smtp_from
     msg["To"] = recipient
     msg["Subject"] = subject or f"Rechnung: {pdf_path.stem}"
 
     # Body
-    body_text = body or (
-        f"Anbei die Rechnung {pdf_path.name} zur Verbuchung.\n\n"
-        "Diese E-Mail wurde automatisch generiert."
-    )
-    msg.attach(MIMEText(body_text, "plain", "utf-8"))
+    body_text = body or _BODY_TEMPLATE.format(name=pdf_path.name)
+    msg.set_content(body_text)
 
     # Attach PDF
-    with open(pdf_path, "rb") as f:
-        pdf_attachment = MIMEApplication(f.read(), _subtype="pdf")
-        pdf_attachment.add_header(
-            "Content-Disposition", "attachment", filename=pdf_path.name
-        )
-        msg.attach(pdf_attachment)
+    msg.make_mixed()
+    msg.attach(_pdf_attachment(pdf_path))
 
-    # Attach ZUGFeRD XML if provided
+    # Attach ZUGFeRD XML if provided (standard ZUGFeRD filename)
     if xml_content:
-        xml_attachment = MIMEApplication(
-            xml_content.encode("utf-8"), _subtype="xml"
-        )
-        # Standard ZUGFeRD filename
-        xml_filename = "factur-x.xml"
-        xml_attachment.add_header(
-            "Content-Disposition", "attachment", filename=xml_filename
+        msg.add_attachment(
+            xml_content.encode("utf-8"),
+            maintype="application",
+            subtype="xml",
+            filename="factur-x.xml",
         )
-        msg.attach(xml_attachment)
 
     # Send
-    with smtplib.SMTP(config.smtp_host, config.smtp_port) as server:
-        if config.smtp_use_tls:
-            server.starttls()
-        server.login(config.smtp_user, config.smtp_password)
+    if server is not None:
         server.send_message(msg)
+    else:
+        with smtp_session(config) as session:
+            session.send_message(msg)
+
@@ -7,14 +7,19 @@ Focused on Buchhaltung Pro use cases:
 - Buchungen (Accounting Documents)
 """
 
+from collections.abc import Callable, Sequence
 from datetime import date
 from decimal import Decimal
 from enum import IntEnum
-from typing import Any, Self
+from functools import lru_cache
+from typing import Any, ClassVar, Self
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
+# Document and due dates repeat across the rows of a response, so the
+# parsed values are cached (dates and Decimals are immutable)
+@lru_cache(maxsize=8192)
 def parse_collmex_date(value: str) -> date | None:
     """Parse Collmex date format (YYYYMMDD) to date object."""
     if not value:
@@ -27,9 +32,11 @@ def format_collmex_date(value: date | None) -> str:
     """Format date to Collmex format (YYYYMMDD)."""
     if value is None:
         return ""
-    return value.strftime("%Y%m%d")
+    # Direct integer formatting avoids strftime's per-call format parsing
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
 
 
+@lru_cache(maxsize=8192)
 def parse_collmex_decimal(value: str) -> Decimal | None:
     """Parse Collmex decimal format (German: comma as decimal separator)."""
     if not value:
@@ -41,7 +48,27 @@ def format_collmex_decimal(value: Decimal | None) -> str:
     """Format Decimal to Collmex format (German: comma as decimal separator)."""
     if value is None:
         return ""
-    return str(value).replace(".", ",")
+    # str() is the fast path; it only switches to exponent notation for values
+    # like Decimal("1E+2"), which Collmex can't read
+    text = str(value)
+    if "E" in text:
+        text = format(value, "f")
+    return text.replace(".", ",")
+
+
+def _parse_int(value: str) -> int:
+    """Parse an integer CSV field (empty means 0)."""
+    return int(value) if value else 0
+
+
+def _parse_optional_int(value: str) -> int | None:
+    """Parse an integer CSV field where empty or 0 means unset."""
+    return (int(value) or None) if value else None
+
+
+def _parse_company_id(value: str) -> int:
+    """Parse the company ID CSV field (empty means company 1)."""
+    return int(value) if value else 1
 
 
 class OutputMedium(IntEnum):
@@ -57,12 +84,52 @@ class OutputMedium(IntEnum):
 class CollmexRecord(BaseModel):
     """Base class for Collmex records."""
 
-    model_config = {"extra": "ignore"}
+    # Records are shared by the response and vendor caches, so they are
+    # read-only (this also makes them hashable)
+    model_config = {"extra": "ignore", "frozen": True}
+
+    # Field name -> (CSV column, parser), used to read records from CSV rows
+    CSV_FIELDS: ClassVar[dict[str, tuple[int, Callable[[str], Any]]]] = {}
+
+    # Number of columns CSV_FIELDS reads (shorter rows are padded with "")
+    CSV_WIDTH: ClassVar[int] = 0
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.CSV_WIDTH = max((idx + 1 for idx, _ in cls.CSV_FIELDS.values()), default=0)
 
     @classmethod
     def from_csv_row(cls, row: list[str]) -> Self:
-        """Create a record from a CSV row."""
-        raise NotImplementedError
+        """Create a record from a CSV row, as described by CSV_FIELDS."""
+        if not cls.CSV_FIELDS:
+            raise NotImplementedError
+        if len(row) < cls.CSV_WIDTH:
+            row = row + [""] * (cls.CSV_WIDTH - len(row))
+        # model_validate() takes the dict as is, cls(**...) would repack it
+        return cls.model_validate(
+            {name: parse(row[idx]) for name, (idx, parse) in cls.CSV_FIELDS.items()}
+        )
+
+    @classmethod
+    def project_from_csv_row(cls, row: list[str], fields: Sequence[str]) -> tuple:
+        """Parse only the named fields of a CSV row, without building a model.
+
+        Meant for views that show a few columns of many records: values are
+        parsed as in from_csv_row(), but everything else (including model
+        validation) is skipped.
+
+        Args:
+            row: CSV row data
+            fields: Field names to extract (must be in CSV_FIELDS)
+
+        Returns:
+            The parsed values, in the order of fields
+        """
+        if len(row) < cls.CSV_WIDTH:
+            row = row + [""] * (cls.CSV_WIDTH - len(row))
+        columns = cls.CSV_FIELDS
+        return tuple(parse(row[idx]) for idx, parse in (columns[name] for name in fields))
 
     def to_csv_row(self) -> list[str]:
         """Convert record to CSV row for API submission."""
@@ -116,48 +183,47 @@ class Vendor(CollmexRecord):
     private_person: int = Field(default=0, description="1 if private person")
     url: str = Field(default="", description="Website URL")
 
-    @classmethod
-    def from_csv_row(cls, row: list[str]) -> Self:
-        """Create Vendor from CSV row."""
-
-        def get(idx: int, default: str = "") -> str:
-            return row[idx] if idx < len(row) else default
-
-        def get_int(idx: int, default: int = 0) -> int:
-            val = get(idx)
-            return int(val) if val else default
-
-        return cls(
-            record_type=get(0),
-            vendor_id=get_int(1) or None,
-            company_id=get_int(2, 1),
-            salutation=get(3),
-            title=get(4),
-            first_name=get(5),
-            last_name=get(6),
-            company_name=get(7),
-            department=get(8),
-            street=get(9),
-            postal_code=get(10),
-            city=get(11),
-            notes=get(12),
-            inactive=get_int(13),
-            country=get(14) or "DE",
-            phone=get(15),
-            fax=get(16),
-            email=get(17),
-            bank_account=get(18),
-            bank_code=get(19),
-            iban=get(20),
-            bic=get(21),
-            bank_name=get(22),
-            tax_id=get(23),
-            vat_id=get(24),
-            payment_terms=get_int(25),
-            delivery_terms=get(26),
-            delivery_terms_extra=get(27),
-            output_medium=get_int(28),
-        )
+    CSV_FIELDS: ClassVar[dict[str, tuple[int, Callable[[str], Any]]]] = {
+        "record_type": (0, str),
+        "vendor_id": (1, _parse_optional_int),
+        "company_id": (2, _parse_company_id),
+        "salutation": (3, str),
+        "title": (4, str),
+        "first_name": (5, str),
+        "last_name": (6, str),
+        "company_name": (7, str),
+        "department": (8, str),
+        "street": (9, str),
+        "postal_code": (10, str),
+        "city": (11, str),
+        "notes": (12, str),
+        "inactive": (13, _parse_int),
+        "country": (14, lambda value: value or "DE"),
+        "phone": (15, str),
+        "fax": (16, str),
+        "email": (17, str),
+        "bank_account": (18, str),
+        "bank_code": (19, str),
+        "iban": (20, str),
+        "bic": (21, str),
+        "bank_name": (22, str),
+        "tax_id": (23, str),
+        "vat_id": (24, str),
+        "payment_terms": (25, _parse_int),
+        "delivery_terms": (26, str),
+        "delivery_terms_extra": (27, str),
+        "output_medium": (28, _parse_int),
+    }
+
+    @staticmethod
+    def format_display_name(company_name: str, first_name: str, last_name: str) -> str:
+        """Company name, or "first last" for vendors without one."""
+        return company_name or f"{first_name} {last_name}".strip()
+
+    @property
+    def display_name(self) -> str:
+        """Name to show for the vendor (see format_display_name())."""
+        return self.format_display_name(self.company_name, self.first_name, self.last_name)
 
     def to_csv_row(self) -> list[str]:
         """Convert to CSV row for creating/updating vendor."""
@@ -295,6 +361,29 @@ class OpenItem(CollmexRecord):
     paid: Decimal | None = Field(default=None, description="Amount paid")
     open_amount: Decimal | None = Field(default=None, description="Open amount")
 
+    CSV_FIELDS: ClassVar[dict[str, tuple[int, Callable[[str], Any]]]] = {
+        "record_type": (0, str),
+        "company_id": (1, _parse_company_id),
+        "fiscal_year": (2, _parse_int),
+        "booking_id": (3, _parse_int),
+        "position": (4, _parse_int),
+        "customer_id": (5, _parse_optional_int),
+        "customer_name": (6, str),
+        "vendor_id": (7, _parse_optional_int),
+        "vendor_name": (8, str),
+        "invoice_number": (9, str),
+        "document_date": (10, parse_collmex_date),
+        "payment_terms": (11, _parse_int),
+        "due_date": (12, parse_collmex_date),
+        "days_overdue": (13, _parse_int),
+        "dunning_level": (14, _parse_int),
+        "dunning_date": (15, parse_collmex_date),
+        "dunning_fees": (16, parse_collmex_decimal),
+        "amount": (17, parse_collmex_decimal),
+        "paid": (18, parse_collmex_decimal),
+        "open_amount": (19, parse_collmex_decimal),
+    }
+
     @field_validator("document_date", "due_date", "dunning_date", mode="before")
     @classmethod
     def parse_date(cls, v: Any) -> date | None:
@@ -304,40 +393,6 @@ class OpenItem(CollmexRecord):
             return parse_collmex_date(v)
         return None
 
-    @classmethod
-    def from_csv_row(cls, row: list[str]) -> Self:
-        """Create OpenItem from CSV row."""
-
-        def get(idx: int, default: str = "") -> str:
-            return row[idx] if idx < len(row) else default
-
-        def get_int(idx: int, default: int = 0) -> int:
-            val = get(idx)
-            return int(val) if val else default
-
-        return cls(
-            record_type=get(0),
-            company_id=get_int(1, 1),
-            fiscal_year=get_int(2),
-            booking_id=get_int(3),
-            position=get_int(4),
-            customer_id=get_int(5) or None,
-            customer_name=get(6),
-            vendor_id=get_int(7) or None,
-            vendor_name=get(8),
-            invoice_number=get(9),
-            document_date=get(10),
-            payment_terms=get_int(11),
-            due_date=get(12),
-            days_overdue=get_int(13),
-            dunning_level=get_int(14),
-            dunning_date=get(15),
-            dunning_fees=parse_collmex_decimal(get(16)),
-            amount=parse_collmex_decimal(get(17)),
-            paid=parse_collmex_decimal(get(18)),
-            open_amount=parse_collmex_decimal(get(19)),
-        )
-
 
 # =============================================================================
 # Accounting Document (Buchung) - ACCDOC
@@ -379,6 +434,37 @@ class AccountingDocument(CollmexRecord):
     memo: str = Field(default="", description="Internal memo")
     user: str = Field(default="", description="User who created the entry")
 
+    CSV_FIELDS: ClassVar[dict[str, tuple[int, Callable[[str], Any]]]] = {
+        "record_type": (0, str),
+        "company_id": (1, _parse_company_id),
+        "fiscal_year": (2, _parse_int),
+        "booking_id": (3, _parse_int),
+        "document_date": (4, parse_collmex_date),
+        "booked_date": (5, parse_collmex_date),
+        "booking_text": (6, str),
+        "position": (7, _parse_int),
+        "account_number": (8, _parse_int),
+        "account_name": (9, str),
+        "debit_credit": (10, str),
+        "amount": (11, parse_collmex_decimal),
+        "customer_id": (12, _parse_optional_int),
+        "customer_name": (13, str),
+        "vendor_id": (14, _parse_optional_int),
+        "vendor_name": (15, str),
+        "asset_id": (16, _parse_optional_int),
+        "asset_name": (17, str),
+        "cancelled_booking": (18, _parse_optional_int),
+        "cost_center": (19, str),
+        "invoice_number": (20, str),
+        "customer_order_id": (21, _parse_optional_int),
+        "travel_id": (22, _parse_optional_int),
+        "supplier_order_id": (23, _parse_optional_int),
+        "payment_id": (24, _parse_optional_int),
+        "document_number": (25, str),
+        "memo": (26, str),
+        "user": (27, str),
+    }
+
     @field_validator("document_date", "booked_date", mode="before")
     @classmethod
     def parse_date(cls, v: Any) -> date | None:
@@ -388,48 +474,6 @@ class AccountingDocument(CollmexRecord):
             return parse_collmex_date(v)
         return None
 
-    @classmethod
-    def from_csv_row(cls, row: list[str]) -> Self:
-        """Create AccountingDocument from CSV row."""
-
-        def get(idx: int, default: str = "") -> str:
-            return row[idx] if idx < len(row) else default
-
-        def get_int(idx: int, default: int = 0) -> int:
-            val = get(idx)
-            return int(val) if val else default
-
-        return cls(
-            record_type=get(0),
-            company_id=get_int(1, 1),
-            fiscal_year=get_int(2),
-            booking_id=get_int(3),
-            document_date=get(4),
-            booked_date=get(5),
-            booking_text=get(6),
-            position=get_int(7),
-            account_number=get_int(8),
-            account_name=get(9),
-            debit_credit=get(10),
-            amount=parse_collmex_decimal(get(11)),
-            customer_id=get_int(12) or None,
-            customer_name=get(13),
-            vendor_id=get_int(14) or None,
-            vendor_name=get(15),
-            asset_id=get_int(16) or None,
-            asset_name=get(17),
-            cancelled_booking=get_int(18) or None,
-            cost_center=get(19),
-            invoice_number=get(20),
-            customer_order_id=get_int(21) or None,
-            travel_id=get_int(22) or None,
-            supplier_order_id=get_int(23) or None,
-            payment_id=get_int(24) or None,
-            document_number=get(25),
-            memo=get(26),
-            user=get(27),
-        )
-
 
 # =============================================================================
 # Record type mapping
@@ -461,3 +505,13 @@ def parse_record(row: list[str]) -> CollmexRecord | None:
         return None
 
     return model_class.from_csv_row(row)
+
+
+# =============================================================================
+# List serialization
+# =============================================================================
+
+# Dump a whole result list in one call instead of model_dump() per record
+VENDOR_LIST_ADAPTER = TypeAdapter(list[Vendor])
+OPEN_ITEM_LIST_ADAPTER = TypeAdapter(list[OpenItem])
+ACCOUNTING_DOCUMENT_LIST_ADAPTER = TypeAdapter(list[AccountingDocument])
@@ -17,6 +17,20 @@ from drafthorse.models.tradelines import LineItem
 from .config import CollmexConfig, get_config
 from .models import Vendor
 
+_ZERO = Decimal("0.00")
+_HUNDRED = Decimal(100)
+_ONE_BASIS_QUANTITY = Decimal("1.000")
+_DEFAULT_TAX_RATE = Decimal("19.00")
+
+
+def _to_decimal(value: Decimal | int | float | str) -> Decimal:
+    """Convert a line item number to Decimal (floats via str, to keep e.g. 0.1 exact)."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
 
 def create_zugferd_xml(
     vendor: Vendor,
@@ -28,7 +42,8 @@ def create_zugferd_xml(
     payment_terms_text: str | None = None,
     due_date: date | None = None,
     notes: str | None = None,
-) -> str:
+    validate: bool = True,
+) -> bytes:
     """Create a ZUGFeRD 2.x XML document for a vendor invoice.
 
     Args:
@@ -46,9 +61,12 @@ def create_zugferd_xml(
         payment_terms_text: Payment terms description
         due_date: Payment due date
         notes: Additional notes for the invoice
+        validate: Check the XML against the EN 16931 schema. Loading the
+            schema costs more than building the document, so bulk callers
+            generating from trusted data can pass False.
 
     Returns:
-        XML string in UN/CEFACT CII format (EN 16931)
+        UTF-8 encoded XML document in UN/CEFACT CII format (EN 16931)
     """
     config = config or get_config()
 
@@ -71,7 +89,7 @@ def create_zugferd_xml(
         doc.header.notes.add(note)
 
     # Seller (Vendor) party
-    doc.trade.agreement.seller.name = vendor.company_name or f"{vendor.first_name} {vendor.last_name}".strip()
+    doc.trade.agreement.seller.name = vendor.display_name
 
     if vendor.street:
         doc.trade.agreement.seller.address.line_one = vendor.street
@@ -111,8 +129,9 @@ def create_zugferd_xml(
         )
 
     # Line items
-    total_net = Decimal("0.00")
-    tax_amounts: dict[str, tuple[Decimal, Decimal]] = {}  # rate -> (basis, tax)
+    total_net = _ZERO
+    # rate -> [basis, tax]; equal rates share a bucket (19 and 19.00 alike)
+    tax_amounts: dict[Decimal, list[Decimal]] = {}
 
     for i, item in enumerate(line_items, start=1):
         line = LineItem()
@@ -120,13 +139,13 @@ def create_zugferd_xml(
 
         line.product.name = item["description"]
 
-        quantity = Decimal(str(item["quantity"]))
-        unit_price = Decimal(str(item["unit_price"]))
-        tax_rate = Decimal(str(item.get("tax_rate", "19.00")))
+        quantity = _to_decimal(item["quantity"])
+        unit_price = _to_decimal(item["unit_price"])
+        tax_rate = _to_decimal(item.get("tax_rate", _DEFAULT_TAX_RATE))
         unit = item.get("unit", "C62")  # C62 = pieces
 
         line.agreement.net.amount = unit_price
-        line.agreement.net.basis_quantity = (Decimal("1.000"), unit)
+        line.agreement.net.basis_quantity = (_ONE_BASIS_QUANTITY, unit)
 
         line.delivery.billed_quantity = (quantity, unit)
 
@@ -140,13 +159,13 @@ def create_zugferd_xml(
         total_net += line_total
 
         # Accumulate tax by rate
-        rate_key = str(tax_rate)
-        tax_amount = line_total * tax_rate / Decimal("100")
-        if rate_key in tax_amounts:
-            basis, tax = tax_amounts[rate_key]
-            tax_amounts[rate_key] = (basis + line_total, tax + tax_amount)
+        tax_amount = line_total * tax_rate / _HUNDRED
+        bucket = tax_amounts.get(tax_rate)
+        if bucket is None:
+            tax_amounts[tax_rate] = [line_total, tax_amount]
         else:
-            tax_amounts[rate_key] = (line_total, tax_amount)
+            bucket[0] += line_total
+            bucket[1] += tax_amount
 
         doc.trade.items.add(line)
 
@@ -170,37 +189,39 @@ def create_zugferd_xml(
         doc.trade.settlement.terms.add(terms)
 
     # Tax breakdown
-    total_tax = Decimal("0.00")
-    for rate_str, (basis, tax) in tax_amounts.items():
+    total_tax = _ZERO
+    for rate, (basis, tax) in tax_amounts.items():
         trade_tax = ApplicableTradeTax()
         trade_tax.calculated_amount = tax
         trade_tax.basis_amount = basis
         trade_tax.type_code = "VAT"
         trade_tax.category_code = "S"
-        trade_tax.rate_applicable_percent = Decimal(rate_str)
+        trade_tax.rate_applicable_percent = rate
         doc.trade.settlement.trade_tax.add(trade_tax)
         total_tax += tax
 
     # Monetary summation
     doc.trade.settlement.monetary_summation.line_total = total_net
-    doc.trade.settlement.monetary_summation.charge_total = Decimal("0.00")
-    doc.trade.settlement.monetary_summation.allowance_total = Decimal("0.00")
+    doc.trade.settlement.monetary_summation.charge_total = _ZERO
+    doc.trade.settlement.monetary_summation.allowance_total = _ZERO
     doc.trade.settlement.monetary_summation.tax_basis_total = total_net
     doc.trade.settlement.monetary_summation.tax_total = (total_tax, "EUR")
     doc.trade.settlement.monetary_summation.grand_total = total_net + total_tax
-    doc.trade.settlement.monetary_summation.prepaid_total = Decimal("0.00")
+    doc.trade.settlement.monetary_summation.prepaid_total = _ZERO
     doc.trade.settlement.monetary_summation.due_payable = total_net + total_tax
 
-    # Generate XML
-    return doc.serialize(schema="FACTUR-X_EN16931")
+    # Generate XML (schema=None still pretty-prints, but skips validation)
+    return doc.serialize(schema="FACTUR-X_EN16931" if validate else None)
 
 
-def save_zugferd_xml(xml_content: str, output_path: Path | str) -> None:
+def save_zugferd_xml(xml_content: bytes | str, output_path: Path | str) -> None:
     """Save ZUGFeRD XML to a file.
 
     Args:
-        xml_content: The XML string
+        xml_content: The XML document as returned by create_zugferd_xml()
+            (already UTF-8 encoded, so it is written as is)
         output_path: Path to save the file
     """
-    path = Path(output_path)
-    path.write_text(xml_content, encoding="utf-8")
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode("utf-8")
+    Path(output_path).write_bytes(xml_content)
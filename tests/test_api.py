@@ -0,0 +1,23 @@
+"""Tests for the low-level Collmex API client."""
+
+from datetime import date
+from decimal import Decimal
+
+from collmex_cli.api import CollmexAPI
+from collmex_cli.config import CollmexConfig
+
+
+def make_api() -> CollmexAPI:
+    return CollmexAPI(CollmexConfig(customer_id="123", username="u", password="p", _env_file=None))
+
+
+def test_encode_csv_quotes_every_field():
+    assert make_api()._encode_csv([["CMXLIF", 'A "B" GmbH', "Müller"]]) == (
+        '"CMXLIF";"A ""B"" GmbH";"Müller"\r\n'.encode("windows-1252")
+    )
+
+
+def test_encode_csv_formats_non_str_fields():
+    row = ["CMXLRN", 1, None, Decimal("1.5"), date(2024, 1, 2), True]
+
+    assert make_api()._encode_csv([row]) == b'"CMXLRN";"1";"";"1,5";"20240102";"1"\r\n'
@@ -0,0 +1,57 @@
+"""Tests for CollmexClient vendor matching."""
+
+import pytest
+
+from collmex_cli.client import CollmexClient
+from collmex_cli.config import CollmexConfig
+from collmex_cli.models import Vendor
+
+VENDORS = [
+    Vendor(vendor_id=1, company_name="Deutsche Telekom AG"),
+    Vendor(vendor_id=2, first_name="Hans", last_name="Meier"),
+    Vendor(vendor_id=3, company_name="Amazon EU S.a.r.l."),
+    Vendor(vendor_id=4, company_name="Deutsche Bahn AG"),
+]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    config = CollmexConfig(customer_id="123", username="u", password="p", _env_file=None)
+    client = CollmexClient(config)
+    monkeypatch.setattr(client, "get_vendors", lambda: VENDORS)
+    return client
+
+
+@pytest.mark.parametrize(
+    ("name", "vendor_id"),
+    [
+        ("Deutsche Telekom AG", 1),  # identical
+        ("hans meier", 2),  # identical, ignoring case
+        ("Meier Hans", 2),  # same words, reordered
+        ("Amazon EU", 3),  # substring
+        ("Deutsche Telekom AG Bonn", 1),  # vendor name is a substring
+    ],
+)
+def test_match_vendor_name_exact(client, name, vendor_id):
+    result = client.match_vendor(name=name)
+    assert result["match"] == "exact"
+    assert result["vendor_id"] == vendor_id
+
+
+@pytest.mark.parametrize(
+    ("name", "vendor_ids"),
+    [
+        ("Deutsche Bank", [4]),  # near miss is a candidate, not a match
+        ("Telekom Deutschland", [1]),
+        ("Hans Maier", [2]),
+    ],
+)
+def test_match_vendor_name_fuzzy(client, name, vendor_ids):
+    result = client.match_vendor(name=name)
+    assert result["match"] == "fuzzy"
+    assert [c["vendor_id"] for c in result["candidates"]] == vendor_ids
+
+
+@pytest.mark.parametrize("name", ["Google", "Deutsche Post", "Meier Bau GmbH"])
+def test_match_vendor_name_none(client, name):
+    assert client.match_vendor(name=name) == {"match": "none"}
@@ -0,0 +1,82 @@
+"""Tests for the shared CLI helpers."""
+
+from datetime import date
+from decimal import Decimal
+
+import orjson
+import pytest
+from pydantic import TypeAdapter
+
+from collmex_cli.commands.common import (
+    JSON_STREAM_BATCH_SIZE,
+    _format_cell,
+    format_amount,
+    output_json_stream,
+    parse_decimal,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "text"),
+    [
+        (Decimal("100.50"), "100.50"),
+        (Decimal("1E+2"), "100"),
+        (Decimal("-2.5E+3"), "-2500"),
+        (Decimal("0.00"), "0.00"),
+    ],
+)
+def test_format_amount(value, text):
+    assert format_amount(value) == text
+
+
+def test_format_cell():
+    assert _format_cell(None) == ""
+    assert _format_cell("x") == "x"
+    assert _format_cell(Decimal("1E+2")) == "100"
+    assert _format_cell(date(2024, 1, 15)) == "2024-01-15"
+    assert _format_cell(3) == "3"
+
+
+@pytest.mark.parametrize(
+    ("value", "amount"),
+    [("100.50", Decimal("100.50")), ("12,5", Decimal("12.5")), ("-3", Decimal("-3"))],
+)
+def test_parse_decimal(value, amount):
+    assert parse_decimal(value) == amount
+
+
+@pytest.mark.parametrize("value", ["", "abc", "1e2", "1E+2", "NaN", "-Infinity", "1.234,5"])
+def test_parse_decimal_rejects(value):
+    with pytest.raises(ValueError, match="Invalid number"):
+        parse_decimal(value)
+
+
+def _records(count, fail_at=None):
+    for i in range(count):
+        if i == fail_at:
+            raise ValueError("bad record")
+        yield {"id": i}
+
+
+@pytest.mark.parametrize("count", [0, 3, JSON_STREAM_BATCH_SIZE + 1])
+def test_output_json_stream(capsysbinary, count):
+    output_json_stream(_records(count), TypeAdapter(list[dict]))
+
+    assert orjson.loads(capsysbinary.readouterr().out) == [{"id": i} for i in range(count)]
+
+
+def test_output_json_stream_closes_array_on_error(capsysbinary):
+    with pytest.raises(ValueError):
+        records = _records(JSON_STREAM_BATCH_SIZE + 5, fail_at=JSON_STREAM_BATCH_SIZE + 2)
+        output_json_stream(records, TypeAdapter(list[dict]))
+
+    # Only the batches written before the failure, but still valid JSON
+    out = capsysbinary.readouterr().out
+    assert orjson.loads(out) == [{"id": i} for i in range(JSON_STREAM_BATCH_SIZE)]
+
+
+def test_output_json_stream_writes_nothing_if_first_batch_fails(capsysbinary):
+    with pytest.raises(ValueError):
+        output_json_stream(_records(5, fail_at=2), TypeAdapter(list[dict]))
+
+    assert capsysbinary.readouterr().out == b""
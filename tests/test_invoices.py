@@ -0,0 +1,107 @@
+"""Tests for the vendor invoice import command."""
+
+from datetime import date
+from decimal import Decimal
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from collmex_cli.client import CollmexClient
+from collmex_cli.commands.invoices import _read_invoice_rows
+from collmex_cli.config import CollmexConfig
+from collmex_cli.main import app
+
+CSV_HEADER = "vendor_id,invoice_number,invoice_date,net_amount_full_tax\n"
+
+
+def test_read_invoice_rows_csv(tmp_path):
+    path = tmp_path / "invoices.csv"
+    path.write_text(CSV_HEADER + '1,R1,2024-01-15,"100,50"\n2,R2,,\n', encoding="utf-8")
+
+    assert list(_read_invoice_rows(path)) == [
+        {
+            "vendor_id": "1",
+            "invoice_number": "R1",
+            "invoice_date": date(2024, 1, 15),
+            "net_amount_full_tax": Decimal("100.50"),
+        },
+        {"vendor_id": "2", "invoice_number": "R2"},
+    ]
+
+
+def test_read_invoice_rows_jsonl(tmp_path):
+    path = tmp_path / "invoices.jsonl"
+    path.write_text(
+        '{"vendor_id": 1, "invoice_number": "R1", "net_amount_full_tax": 19.99}\n'
+        "\n"
+        '{"vendor_id": 2, "invoice_number": "R2", "net_amount_full_tax": "5,10"}\n',
+        encoding="utf-8",
+    )
+
+    assert list(_read_invoice_rows(path)) == [
+        {"vendor_id": 1, "invoice_number": "R1", "net_amount_full_tax": Decimal("19.99")},
+        {"vendor_id": 2, "invoice_number": "R2", "net_amount_full_tax": Decimal("5.10")},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("name", "content", "message"),
+    [
+        ("extra.csv", CSV_HEADER + "1,R1,2024-01-15,10\n1,R2,2024-01-15,10,oops\n", "line 3"),
+        ("nan.csv", CSV_HEADER + "1,R1,2024-01-15,NaN\n", "line 2: Invalid net_amount_full_tax"),
+        ("date.csv", CSV_HEADER + "1,R1,15.01.2024,10\n", "line 2"),
+        ("list.jsonl", '{"vendor_id": 1}\n[1, 2]\n', "line 2: Expected an object"),
+        ("inf.jsonl", '{"net_amount_full_tax": Infinity}\n', "line 1: Invalid net_amount_full_tax"),
+        ("broken.jsonl", '{"vendor_id": 1\n', "line 1"),
+    ],
+)
+def test_read_invoice_rows_rejects_malformed_lines(tmp_path, name, content, message):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=message):
+        list(_read_invoice_rows(path))
+
+
+class _State:
+    """Minimal ctx.obj handing the command a prepared client."""
+
+    def __init__(self, client: CollmexClient):
+        self.client = client
+
+    def close(self) -> None:
+        pass
+
+
+def test_import_reports_rejected_invoice(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Line 1 is LOGIN, so line 3 is the second invoice
+        return httpx.Response(200, content=b'"MESSAGE";"E";"123";"Ungueltige Rechnung";"3"\r\n')
+
+    config = CollmexConfig(customer_id="123", username="u", password="p", _env_file=None)
+    client = CollmexClient(config)
+    client.api._client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.api._cache["stale"] = (float("inf"), [])
+
+    path = tmp_path / "invoices.csv"
+    path.write_text(
+        CSV_HEADER + "1,R1,2024-01-15,10\n1,R2,2024-01-15,20\n1,R3,2024-01-15,30\n",
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(app, ["vendor-invoices-import", str(path)], obj=_State(client))
+
+    assert result.exit_code == 1
+    assert "Invoice 2 (R2) was rejected" in result.output
+    # Earlier invoices may have been booked, so cached queries are dropped
+    assert client.api._cache == {}
+
+
+@pytest.mark.parametrize("net", ["abc", "1e2", "NaN"])
+def test_vendor_invoice_rejects_bad_amount_as_usage_error(net):
+    args = ["vendor-invoice", "-v", "1", "-i", "R1", "-d", "2024-01-15", "-n", net]
+    result = CliRunner().invoke(app, args, obj=_State(None))
+
+    assert result.exit_code == 2
+    assert "--net" in result.output
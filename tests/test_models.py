@@ -0,0 +1,18 @@
+"""Tests for the Collmex record models."""
+
+from collmex_cli.models import Vendor
+
+
+def test_vendor_display_name():
+    assert Vendor(company_name="ACME GmbH", first_name="Max").display_name == "ACME GmbH"
+    assert Vendor(first_name="Hans", last_name="Meier").display_name == "Hans Meier"
+    assert Vendor(last_name="Meier").display_name == "Meier"
+
+
+def test_vendor_display_name_follows_model_copy():
+    vendor = Vendor(company_name="A")
+    assert vendor.display_name == "A"
+
+    assert vendor.model_copy(update={"company_name": "B"}).display_name == "B"
+    assert vendor.model_copy(update={"company_name": ""}).display_name == ""
+    assert vendor.display_name == "A"